@@ -0,0 +1,116 @@
+"""
+Async variants of the public article read endpoints.
+
+DRF views are synchronous, so these are plain Django async views built on
+the async ORM. Under an ASGI server a single worker process serves many
+concurrent requests on one event loop, which keeps slow clients from tying
+up a whole worker each. See ``pstore/asgi.py`` for how to run them.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotAllowed
+from rest_framework.exceptions import APIException
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+
+from apps.common.renderers import dumps
+
+from .exceptions import ArticleNotFound
+from .models import Article
+from .pagination import ArticleKeysetPagination
+from .search import compile_search, filter_articles, search_cache_key
+from .serializers import ArticleListSerializer, ArticleSerializer
+from .tracking import arecord_view, get_client_ip
+from .views import ListAllArticlesAPIView
+
+
+def json_response(data, status=200):
+    return HttpResponse(dumps(data), status=status, content_type="application/json")
+
+
+def error_response(exc):
+    if isinstance(exc.detail, (list, dict)):
+        return json_response(exc.detail, status=exc.status_code)
+    return json_response({"detail": str(exc.detail)}, status=exc.status_code)
+
+
+async def list_articles(request):
+    """
+    Same contract as ``ListAllArticlesAPIView``, whose filter backends,
+    serializer and pagination it reuses, without the anonymous response
+    cache.
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    request = Request(request)
+    view = ListAllArticlesAPIView(
+        request=request, args=(), kwargs={}, format_kwarg=None
+    )
+    paginator = view.paginator
+    try:
+        queryset = view.filter_queryset(view.get_queryset())
+        articles = await paginator.apaginate_queryset(queryset, request)
+    except APIException as exc:
+        return error_response(exc)
+
+    serializer = view.get_serializer(articles, many=True)
+    return json_response(paginator.get_paginated_response(serializer.data).data)
+
+
+async def article_detail(request, slug):
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    try:
+        article = await Article.objects.select_related("user").aget(slug=slug)
+    except Article.DoesNotExist:
+        return error_response(ArticleNotFound())
+
+    await arecord_view(article.pkid, get_client_ip(request))
+
+    serializer = ArticleSerializer(article, context={"request": request})
+    return json_response(serializer.data)
+
+
+async def search_articles(request):
+    """
+    Same contract as ``ArticleSearchAPIView`` except that the NDJSON stream
+    mode is not available, since Django 4.1 can't stream from async views.
+    """
+    if request.method != "POST":
+        return HttpResponseNotAllowed(["POST"])
+
+    request = Request(request, parsers=[JSONParser()])
+    paginator = ArticleKeysetPagination()
+    try:
+        search = compile_search(request.data)
+        fields = ArticleListSerializer.parse_fields(request.query_params)
+        queryset = ArticleListSerializer.load_only(
+            filter_articles(Article.published.all(), search),
+            fields,
+            extra=["created_at"],
+        )
+
+        page = (
+            request.query_params.get(paginator.cursor_query_param),
+            paginator.get_page_size(request),
+            fields,
+        )
+        cache_key = await sync_to_async(search_cache_key)(search, page)
+
+        state = await cache.aget(cache_key)
+        if state is None:
+            articles = await paginator.apaginate_queryset(queryset, request)
+            data = ArticleListSerializer(articles, many=True, fields=fields).data
+            state = paginator.get_page_state(data)
+            await cache.aset(cache_key, state, settings.ARTICLE_SEARCH_CACHE_TIMEOUT)
+    except APIException as exc:
+        return error_response(exc)
+
+    data = paginator.restore_page_state(request, state)
+    return json_response(paginator.get_paginated_data(data))
+
+
+search_articles.csrf_exempt = True
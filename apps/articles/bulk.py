@@ -0,0 +1,120 @@
+from autoslug.utils import crop_slug
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import invalidate_response_cache
+from .models import Article
+from .refcodes import allocate_ref_codes
+from .search import invalidate_search_cache
+
+
+def slug_candidate(field, base, index):
+    if index == 1:
+        return base
+    suffix = f"{field.index_sep}{index}"
+    return base[: field.max_length - len(suffix)] + suffix
+
+
+def assign_slugs(articles):
+    """
+    Give each article a slug of the form AutoSlugField uses, ``title`` or
+    ``title-N``. Candidates for all the articles are checked against the
+    table with one query per round, rather than one query per candidate.
+    Saved articles don't collide with their own current slug.
+    """
+    field = Article._meta.get_field("slug")
+    pending = {}
+    for article in articles:
+        base = crop_slug(field, field.slugify(article.title))
+        pending.setdefault(base or Article._meta.model_name, []).append(article)
+
+    next_index = dict.fromkeys(pending, 1)
+    assigned = set()
+    while pending:
+        proposals = []
+        for base, group in pending.items():
+            start = next_index[base]
+            next_index[base] += len(group)
+            proposals.extend(
+                (base, slug_candidate(field, base, index))
+                for index in range(start, start + len(group))
+            )
+
+        taken = set(
+            Article.objects.filter(slug__in=[candidate for _, candidate in proposals])
+            .exclude(pkid__in=[article.pkid for article in articles if article.pkid])
+            .values_list("slug", flat=True)
+        )
+        for base, candidate in proposals:
+            if candidate in taken or candidate in assigned:
+                continue
+            article = pending[base].pop(0)
+            article.slug = candidate
+            article._slug_assigned = True
+            assigned.add(candidate)
+
+        pending = {base: group for base, group in pending.items() if group}
+
+
+def assign_ref_codes(articles):
+    """
+    Give the articles without a reference code one from a single block
+    reserved for the whole batch.
+    """
+    pending = [article for article in articles if not article.ref_code]
+    for article, code in zip(pending, allocate_ref_codes(len(pending))):
+        article.ref_code = code
+
+
+def bulk_insert_articles(articles, batch_size=500):
+    """
+    Insert unsaved articles in one transaction, with the slugs, reference
+    codes and search vectors ``Article.save()`` would give them one by one.
+
+    ``bulk_create`` sends no ``post_save`` signals, so the article caches are
+    invalidated here.
+    """
+    for article in articles:
+        article.normalize_text()
+    assign_slugs(articles)
+    assign_ref_codes(articles)
+
+    with transaction.atomic():
+        Article.objects.bulk_create(articles, batch_size=batch_size)
+        Article.objects.filter(
+            ref_code__in=[article.ref_code for article in articles]
+        ).update_search_vectors()
+
+    invalidate_search_cache()
+    invalidate_response_cache()
+    return articles
+
+
+def bulk_update_articles(articles, fields, retitled=(), batch_size=500):
+    """
+    Write ``fields`` of saved articles in one transaction. The articles in
+    ``retitled`` get a new slug, and the search vectors are refreshed when
+    the text changed, as ``save()`` would do. ``bulk_update`` calls no
+    ``pre_save``, so ``updated_at`` is set here.
+    """
+    fields = set(fields) | {"updated_at"}
+    now = timezone.now()
+    for article in articles:
+        article.updated_at = now
+    if {"title", "description"} & fields:
+        for article in articles:
+            article.normalize_text()
+    if retitled:
+        assign_slugs(retitled)
+        fields.add("slug")
+
+    with transaction.atomic():
+        Article.objects.bulk_update(articles, sorted(fields), batch_size=batch_size)
+        if {"title", "description"} & fields:
+            Article.objects.filter(
+                pkid__in=[article.pkid for article in articles]
+            ).update_search_vectors()
+
+    invalidate_search_cache()
+    invalidate_response_cache()
+    return articles
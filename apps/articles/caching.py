@@ -0,0 +1,72 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.utils import encoders
+
+RESPONSE_CACHE_GENERATION_KEY = "articles:responses:generation"
+
+
+def normalize_query(query_params):
+    """
+    Sorted ``(name, value)`` pairs of the query string without empty values,
+    so ``?b=2&a=1&c=`` and ``?a=1&b=2`` share a cache entry.
+    """
+    return tuple(
+        sorted(
+            (name, value)
+            for name, values in query_params.lists()
+            for value in values
+            if value != ""
+        )
+    )
+
+
+def response_cache_key(request):
+    generation = cache.get_or_set(RESPONSE_CACHE_GENERATION_KEY, time.time_ns(), None)
+    variant = (
+        request.get_host(),
+        request.path,
+        request.accepted_renderer.format,
+        normalize_query(request.query_params),
+    )
+    digest = hashlib.sha1(repr(variant).encode()).hexdigest()
+    return f"articles:responses:{generation}:{digest}"
+
+
+def invalidate_response_cache():
+    cache.set(RESPONSE_CACHE_GENERATION_KEY, time.time_ns(), None)
+
+
+def cache_response(key, data, **extra):
+    """
+    Store serialized response data with its ETag and any ``extra`` values the
+    view needs on a cache hit. The ETag is a digest of the JSON content, so
+    it is computed once per entry rather than once per request.
+    """
+    content = json.dumps(data, cls=encoders.JSONEncoder, sort_keys=True)
+    entry = {
+        "etag": f'"{hashlib.sha1(content.encode()).hexdigest()}"',
+        "data": data,
+        **extra,
+    }
+    cache.set(key, entry, settings.ARTICLE_RESPONSE_CACHE_TIMEOUT)
+    return entry
+
+
+def cached_response(request, entry):
+    """
+    Answer from a cache entry, with a bodiless 304 when the client already
+    holds this version.
+    """
+    if entry["etag"] in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", "")):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(entry["data"])
+    response["ETag"] = entry["etag"]
+    return response
@@ -4,3 +4,18 @@ from rest_framework.exceptions import APIException
 class ArticleNotFound(APIException):
     status_code = 404
     default_detail = "The requested article does not exists"
+
+
+class InvalidArticleSearch(APIException):
+    status_code = 400
+    default_detail = "The search parameters are not valid"
+
+
+class InvalidFieldSelection(APIException):
+    status_code = 400
+    default_detail = "The requested fields are not valid"
+
+
+class InvalidBulkRequest(APIException):
+    status_code = 400
+    default_detail = "Expected a list of articles"
@@ -0,0 +1,98 @@
+import logging
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .models import Article
+
+logger = logging.getLogger(__name__)
+
+IMAGE_FIELDS = ["cover_photo", "photo1", "photo2", "photo3", "photo4"]
+
+
+def variant_name(name, variant):
+    stem, _ = os.path.splitext(name)
+    return f"variants/{stem.lstrip('/')}_{variant}.jpg"
+
+
+def render_variant(image, size, quality):
+    """
+    Shrink ``image`` to fit in ``size``, keeping its aspect ratio, and
+    recompress it as a progressive JPEG.
+    """
+    image = image.copy()
+    image.thumbnail(size, Image.Resampling.LANCZOS)
+    if image.mode != "RGB":
+        background = Image.new("RGB", image.size, "white")
+        image = image.convert("RGBA")
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+
+    buffer = BytesIO()
+    image.save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+    return ContentFile(buffer.getvalue())
+
+
+def delete_variants(replaced):
+    for field_name, name in replaced:
+        try:
+            Article._meta.get_field(field_name).storage.delete(name)
+        except OSError as exc:
+            logger.warning(f"can't delete image variant {name}: {exc}")
+
+
+def generate_variants(article_id, fields=IMAGE_FIELDS):
+    """
+    Write the resized variants of an article's images next to the originals
+    and record their names in ``Article.image_variants``. The storage gives
+    each new file a fresh name, so the variants they replace are deleted once
+    the new names are committed.
+    """
+    options = settings.ARTICLE_IMAGE_VARIANTS
+    article = Article.objects.get(pkid=article_id)
+
+    generated = {}
+    for field_name in fields:
+        file = getattr(article, field_name)
+        if not file:
+            continue
+
+        try:
+            with file.open("rb"):
+                image = ImageOps.exif_transpose(Image.open(file))
+                image.load()
+        except (OSError, UnidentifiedImageError) as exc:
+            logger.warning(f"can't read {field_name} of article {article_id}: {exc}")
+            continue
+
+        storage = file.storage
+        generated[field_name] = {
+            variant: storage.save(
+                variant_name(file.name, variant),
+                render_variant(image, size, options["QUALITY"]),
+            )
+            for variant, size in options["SIZES"].items()
+        }
+
+    if not generated:
+        return
+
+    with transaction.atomic():
+        article = Article.objects.select_for_update().get(pkid=article_id)
+        replaced = [
+            (field_name, name)
+            for field_name, variants in generated.items()
+            for name in article.image_variants.get(field_name, {}).values()
+            if name not in variants.values()
+        ]
+        article.image_variants = {**article.image_variants, **generated}
+        article.save(update_fields=["image_variants"])
+        transaction.on_commit(lambda: delete_variants(replaced))
+
+    logger.info(
+        f"generated image variants of {', '.join(generated)} for article {article_id}"
+    )
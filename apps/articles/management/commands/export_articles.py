@@ -0,0 +1,67 @@
+import csv
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.articles.models import Article
+from apps.articles.serializers import ArticleImportSerializer
+from apps.common.renderers import dumps
+
+
+class Command(BaseCommand):
+    help = (
+        "Export articles to CSV or NDJSON in the format import_articles reads, "
+        "streaming rows from the database. Identity columns (id, ref_code, "
+        "slug) are left out: importing always creates new articles"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path", nargs="?", default="-", help="File to write, or - for stdout"
+        )
+        parser.add_argument(
+            "--format",
+            choices=["csv", "ndjson"],
+            help="Defaults to the file extension, or csv for stdout",
+        )
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or (
+            "ndjson" if path.endswith("json") else "csv"
+        )
+        try:
+            stream = (
+                sys.stdout
+                if path == "-"
+                else open(path, "w", newline="", encoding="utf-8")
+            )
+        except OSError as exc:
+            raise CommandError(f"Can't write {path}: {exc.strerror}")
+
+        columns = ArticleImportSerializer.Meta.fields
+        rows = (
+            Article.objects.order_by("pkid")
+            .values_list(*columns)
+            .iterator(chunk_size=options["chunk_size"])
+        )
+
+        exported = 0
+        try:
+            if file_format == "csv":
+                writer = csv.writer(stream)
+                writer.writerow(columns)
+                for row in rows:
+                    writer.writerow(row)
+                    exported += 1
+            else:
+                for row in rows:
+                    stream.write(dumps(dict(zip(columns, row))).decode() + "\n")
+                    exported += 1
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+
+        if stream is not sys.stdout:
+            self.stdout.write(self.style.SUCCESS(f"Exported {exported} article(s)"))
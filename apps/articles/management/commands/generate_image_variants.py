@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from apps.articles.images import generate_variants
+from apps.articles.models import Article
+
+
+class Command(BaseCommand):
+    help = "Generate the resized variants of article images"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Regenerate every article, not only those without variants",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Article.objects.order_by("pkid")
+        if not options["all"]:
+            queryset = queryset.filter(image_variants={})
+
+        count = 0
+        for article_id in queryset.values_list("pkid", flat=True).iterator():
+            generate_variants(article_id)
+            count += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated image variants for {count} article(s)")
+        )
@@ -0,0 +1,107 @@
+import csv
+import json
+import sys
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from apps.articles.bulk import bulk_insert_articles
+from apps.articles.models import Article
+from apps.articles.serializers import ArticleImportSerializer
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Import articles from a CSV or NDJSON file, validating and inserting "
+        "them in batches. Every row creates a new article, with its own slug "
+        "and reference code"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to read, or - for stdin")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "ndjson"],
+            help="Defaults to the file extension, or csv for stdin",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or (
+            "ndjson" if path.endswith("json") else "csv"
+        )
+        try:
+            stream = (
+                sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+            )
+        except OSError as exc:
+            raise CommandError(f"Can't read {path}: {exc.strerror}")
+
+        imported = failed = 0
+        try:
+            rows = self.read(stream, file_format)
+            while batch := list(islice(rows, options["batch_size"])):
+                articles, errors = self.validate(batch)
+                for line, detail in errors:
+                    self.stderr.write(f"line {line}: {json.dumps(detail)}")
+                if articles:
+                    bulk_insert_articles(articles, options["batch_size"])
+                imported += len(articles)
+                failed += len(errors)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Imported {imported} article(s), {failed} rejected")
+        )
+
+    def read(self, stream, file_format):
+        """
+        Yield ``(line, row)`` pairs. Empty CSV cells are left out so the
+        field defaults apply.
+        """
+        if file_format == "csv":
+            reader = csv.DictReader(stream)
+            for row in reader:
+                yield reader.line_num, {
+                    key: value for key, value in row.items() if value != ""
+                }
+            return
+
+        for line, text in enumerate(stream, start=1):
+            if not text.strip():
+                continue
+            try:
+                row = json.loads(text)
+            except json.JSONDecodeError as exc:
+                raise CommandError(f"line {line}: {exc}")
+            if not isinstance(row, dict):
+                raise CommandError(f"line {line}: expected a JSON object")
+            yield line, row
+
+    def validate(self, batch):
+        user_ids = set()
+        for _, row in batch:
+            try:
+                user_ids.add(int(row.get("user")))
+            except (TypeError, ValueError):
+                pass
+
+        serializer = ArticleImportSerializer(
+            context={"users": User.objects.in_bulk(user_ids)}
+        )
+        articles, errors = [], []
+        for line, row in batch:
+            try:
+                data = serializer.run_validation(row)
+            except ValidationError as exc:
+                errors.append((line, exc.detail))
+            else:
+                articles.append(Article(**data))
+        return articles, errors
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from apps.articles.models import Article
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search vectors of all articles"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of articles updated per UPDATE statement",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_pkid = Article.objects.aggregate(last=Max("pkid"))["last"] or 0
+
+        updated = 0
+        for start in range(0, last_pkid, batch_size):
+            updated += Article.objects.filter(
+                pkid__gt=start, pkid__lte=start + batch_size
+            ).update_search_vectors()
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} article(s)"))
@@ -0,0 +1,34 @@
+# Generated by Django 4.1.2 on 2026-10-18 18:40
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_views(apps, schema_editor):
+    ArticleViews = apps.get_model("articles", "ArticleViews")
+    duplicates = (
+        ArticleViews.objects.values("article_id", "ip")
+        .annotate(keep=Min("pkid"), total=Count("pkid"))
+        .filter(total__gt=1)
+    )
+    for duplicate in duplicates:
+        ArticleViews.objects.filter(
+            article_id=duplicate["article_id"], ip=duplicate["ip"]
+        ).exclude(pkid=duplicate["keep"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0002_alter_article_views"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_views, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="articleviews",
+            constraint=models.UniqueConstraint(
+                fields=("article", "ip"), name="unique_article_view_per_ip"
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.1.2 on 2026-10-18 18:45
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+def populate_search_vectors(apps, schema_editor):
+    Article = apps.get_model("articles", "Article")
+    config = settings.ARTICLE_SEARCH_CONFIG
+    Article.objects.update(
+        search_vector=SearchVector("title", weight="A", config=config)
+        + SearchVector("description", weight="B", config=config)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0003_articleviews_unique_article_view_per_ip"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="article",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="article_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title"],
+                name="article_title_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["description"],
+                name="article_description_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.RunPython(populate_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.2 on 2026-10-18 19:10
+
+import apps.articles.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0004_article_search_vector"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="article",
+            name="slug",
+            field=apps.articles.models.ArticleSlugField(
+                always_update=True, editable=False, populate_from="title", unique=True
+            ),
+        ),
+    ]
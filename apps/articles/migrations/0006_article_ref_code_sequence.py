@@ -0,0 +1,17 @@
+# Generated by Django 4.1.2 on 2026-10-18 19:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0005_article_slug_field"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE SEQUENCE article_ref_code_seq",
+            reverse_sql="DROP SEQUENCE article_ref_code_seq",
+        ),
+    ]
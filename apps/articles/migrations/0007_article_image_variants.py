@@ -0,0 +1,18 @@
+# Generated by Django 4.1.2 on 2026-10-18 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0006_article_ref_code_sequence"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
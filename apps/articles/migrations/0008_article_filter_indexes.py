@@ -0,0 +1,56 @@
+# Generated by Django 4.1.2 on 2026-10-18 15:54
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Build the indexes without locking the table against writes
+    atomic = False
+
+    dependencies = [
+        ("articles", "0007_article_image_variants"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="article",
+            index=models.Index(
+                fields=["created_at", "pkid"], name="article_created_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="article",
+            index=models.Index(
+                fields=["user", "created_at"], name="article_user_created_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="article",
+            index=models.Index(
+                fields=["advert_type", "article_type", "created_at"],
+                name="article_type_created_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="article",
+            index=models.Index(fields=["price"], name="article_price_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("published_status", True)),
+                fields=["created_at", "pkid"],
+                name="article_published_created_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("published_status", True)),
+                fields=["advert_type", "article_type", "created_at", "pkid"],
+                name="article_published_type_idx",
+            ),
+        ),
+    ]
@@ -1,20 +1,57 @@
-import random
-import string
+import uuid
+from collections import Counter
 
 from autoslug import AutoSlugField
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import connection, models
+from django.db.models import F, Q
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
 
 from apps.common.models import TimeStampedUUIDModel
 
+from .refcodes import next_ref_code
+
 # Create your models here.
 
 User = get_user_model()
 
 
+def article_search_vector():
+    config = settings.ARTICLE_SEARCH_CONFIG
+    return SearchVector("title", weight="A", config=config) + SearchVector(
+        "description", weight="B", config=config
+    )
+
+
+class ArticleQuerySet(models.QuerySet):
+    def update_search_vectors(self):
+        return self.update(search_vector=article_search_vector())
+
+
+class ArticleManager(models.Manager.from_queryset(ArticleQuerySet)):
+    def increment_views(self, article_id, count=1):
+        return self.filter(pkid=article_id).update(views=F("views") + count)
+
+
+class ArticleSlugField(AutoSlugField):
+    """
+    AutoSlugField that keeps a slug assigned beforehand by
+    ``apps.articles.bulk.assign_slugs``, instead of looking for a free slug
+    with one query per row when the article is inserted.
+    """
+
+    def pre_save(self, instance, add):
+        if getattr(instance, "_slug_assigned", False):
+            return getattr(instance, self.attname)
+        return super().pre_save(instance, add)
+
+
 class ArticlePublishedManager(models.Manager):
     def get_queryset(self):
         return (
@@ -46,7 +83,7 @@ class Article(TimeStampedUUIDModel):
         on_delete=models.DO_NOTHING,
     )
     title = models.CharField(verbose_name=_("Article Title"), max_length=250)
-    slug = AutoSlugField(populate_from="title", unique=True, always_update=True)
+    slug = ArticleSlugField(populate_from="title", unique=True, always_update=True)
     ref_code = models.CharField(
         verbose_name=_("Article Reference Code"),
         max_length=255,
@@ -109,8 +146,11 @@ class Article(TimeStampedUUIDModel):
         verbose_name=_("Published Status"), default=False
     )
     views = models.IntegerField(verbose_name=_("Total Views"), default=0)
+    # Names of the resized copies of each image, see apps.articles.images
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
 
-    objects = models.Manager()
+    objects = ArticleManager()
     published = ArticlePublishedManager()
 
     def __str__(self) -> str:
@@ -119,16 +159,57 @@ class Article(TimeStampedUUIDModel):
     class Meta:
         verbose_name = "Article"
         verbose_name_plural = "Articles"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="article_search_vector_idx"),
+            GinIndex(
+                fields=["title"],
+                name="article_title_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["description"],
+                name="article_description_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            # Newest first listings, read backwards for -created_at
+            models.Index(fields=["created_at", "pkid"], name="article_created_idx"),
+            models.Index(
+                fields=["user", "created_at"], name="article_user_created_idx"
+            ),
+            models.Index(
+                fields=["advert_type", "article_type", "created_at"],
+                name="article_type_created_idx",
+            ),
+            models.Index(fields=["price"], name="article_price_idx"),
+            # The search endpoint only ever reads published articles, in
+            # keyset order on (created_at, pkid)
+            models.Index(
+                fields=["created_at", "pkid"],
+                condition=Q(published_status=True),
+                name="article_published_created_idx",
+            ),
+            models.Index(
+                fields=["advert_type", "article_type", "created_at", "pkid"],
+                condition=Q(published_status=True),
+                name="article_published_type_idx",
+            ),
+        ]
 
-    def save(self, *args, **kwargs):
+    def normalize_text(self):
         self.title = str.title(self.title)
         self.description = str.capitalize(self.description)
-        self.ref_code = "".join(
-            random.choices(string.ascii_uppercase + string.digits, k=10)
-        )
+
+    def save(self, *args, **kwargs):
+        self.normalize_text()
+        if self._state.adding and not self.ref_code:
+            self.ref_code = next_ref_code()
 
         super(Article, self).save(*args, **kwargs)
 
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"title", "description"} & set(update_fields):
+            Article.objects.filter(pkid=self.pkid).update_search_vectors()
+
     @property
     def final_article_title(self):
         tax_percentage = self.tax
@@ -138,12 +219,61 @@ class Article(TimeStampedUUIDModel):
         return price_after_tax
 
 
+class ArticleViewsManager(models.Manager):
+    def record(self, pairs):
+        """
+        Insert ``(article_pkid, ip)`` pairs with ``ON CONFLICT DO NOTHING`` and
+        return a Counter of newly recorded views per article pkid. Pairs that
+        were already recorded are skipped by the unique constraint, so no
+        lookup is needed beforehand.
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return Counter()
+
+        opts = self.model._meta
+        fields = [
+            opts.get_field(name)
+            for name in ("id", "created_at", "updated_at", "ip", "article")
+        ]
+        columns = ", ".join(connection.ops.quote_name(f.column) for f in fields)
+        row_sql = "(" + ", ".join(["%s"] * len(fields)) + ")"
+        article_column = connection.ops.quote_name(opts.get_field("article").column)
+        ip_column = connection.ops.quote_name(opts.get_field("ip").column)
+
+        now = timezone.now()
+        batch_size = connection.ops.bulk_batch_size(fields, pairs)
+        inserted = Counter()
+        with connection.cursor() as cursor:
+            for start in range(0, len(pairs), batch_size):
+                end = start + batch_size
+                batch = pairs[start:end]
+                params = []
+                for article_id, ip in batch:
+                    values = (uuid.uuid4(), now, now, ip, article_id)
+                    params.extend(
+                        f.get_db_prep_save(value, connection)
+                        for f, value in zip(fields, values)
+                    )
+                cursor.execute(
+                    f"INSERT INTO {connection.ops.quote_name(opts.db_table)} "
+                    f"({columns}) VALUES {', '.join([row_sql] * len(batch))} "
+                    f"ON CONFLICT ({article_column}, {ip_column}) DO NOTHING "
+                    f"RETURNING {article_column}",
+                    params,
+                )
+                inserted.update(row[0] for row in cursor.fetchall())
+        return inserted
+
+
 class ArticleViews(TimeStampedUUIDModel):
     ip = models.CharField(verbose_name=_("IP Address"), max_length=250)
     article = models.ForeignKey(
         Article, related_name="article_views", on_delete=models.CASCADE
     )
 
+    objects = ArticleViewsManager()
+
     def __str__(self) -> str:
         return (
             f"Total views on - {self.article.title} is - {self.article.views} view(s)"
@@ -152,3 +282,8 @@ class ArticleViews(TimeStampedUUIDModel):
     class Meta:
         verbose_name = "Total Views on Article"
         verbose_name_plural = "Total Articles Views"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["article", "ip"], name="unique_article_view_per_ip"
+            )
+        ]
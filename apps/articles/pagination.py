@@ -1,5 +1,166 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class ArticlePagination(PageNumberPagination):
     page_size = 3
+
+    async def apaginate_queryset(self, queryset, request):
+        """
+        ``paginate_queryset`` on the async ORM, with the same page parsing
+        and the same 404 for pages out of range.
+        """
+        page_size = self.get_page_size(request)
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Counted up front, so looking up the page below doesn't query
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            )
+            raise NotFound(msg)
+
+        self.request = request
+        return [article async for article in self.page.object_list]
+
+
+class ArticleKeysetPagination(BasePagination):
+    """
+    Forward-only keyset pagination, newest first on ``(created_at, pkid)`` or
+    most relevant first on ``(rank, pkid)`` for ranked searches.
+
+    The cursor holds the ordering values of the last article on the page, so
+    each page is an index range scan no matter how deep the client has paged,
+    unlike an OFFSET that has to walk every earlier row.
+    """
+
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    ordering = ("-created_at", "-pkid")
+    ranked_ordering = ("-rank", "-pkid")
+    cursor_types = {"created_at": parse_datetime, "pkid": int, "rank": float}
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_ordering(self, queryset):
+        if "rank" in queryset.query.annotations:
+            return self.ranked_ordering
+        return self.ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page = list(self.get_page_queryset(queryset, request))
+        return self.set_page(page)
+
+    async def apaginate_queryset(self, queryset, request):
+        page = [article async for article in self.get_page_queryset(queryset, request)]
+        return self.set_page(page)
+
+    def get_page_queryset(self, queryset, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        ordering = self.get_ordering(queryset)
+        self.fields = [field.lstrip("-") for field in ordering]
+
+        queryset = queryset.order_by(*ordering)
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.after(position))
+        return queryset[: self.page_size + 1]
+
+    def set_page(self, page):
+        self.has_next = len(page) > self.page_size
+        page = page[: self.page_size]
+        self.next_position = None
+        if page:
+            self.next_position = [getattr(page[-1], field) for field in self.fields]
+        return page
+
+    def after(self, position):
+        condition = Q()
+        for index, field in enumerate(self.fields):
+            step = Q(**{f"{field}__lt": position[index]})
+            for previous, value in zip(self.fields[:index], position[:index]):
+                step &= Q(**{previous: value})
+            condition |= step
+        return condition
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            values = json.loads(urlsafe_b64decode(encoded.encode()))
+            if len(values) != len(self.fields):
+                raise ValueError
+            position = [
+                self.cursor_types[field](value)
+                for field, value in zip(self.fields, values)
+            ]
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if None in position:
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def encode_cursor(self, position):
+        values = [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in position
+        ]
+        return urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    def get_page_state(self, data):
+        """
+        The page without its links, for caching. The next link is built from
+        the request, so it is left out and rebuilt for every request served
+        from the cache.
+        """
+        return {
+            "results": data,
+            "has_next": self.has_next,
+            "next_position": self.next_position,
+        }
+
+    def restore_page_state(self, request, state):
+        self.request = request
+        self.has_next = state["has_next"]
+        self.next_position = state["next_position"]
+        return state["results"]
+
+    def get_paginated_data(self, data):
+        return {"next": self.get_next_link(), "results": data}
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
@@ -0,0 +1,59 @@
+"""
+Article reference codes.
+
+Each code encodes a value drawn from the ``article_ref_code_seq`` sequence.
+PostgreSQL never hands out a sequence value twice, even when the drawing
+transaction rolls back, so codes are unique without looking at the table
+and without retrying on IntegrityError.
+
+The value is spread over the code space with an affine map that has an
+inverse modulo the code space, so consecutive articles don't get
+consecutive codes and distinct values still give distinct codes. Codes are
+one character longer than the random codes articles used to get, so the
+two kinds can never collide.
+"""
+import string
+
+from django.db import connection
+
+ALPHABET = string.digits + string.ascii_uppercase
+REF_CODE_LENGTH = 11
+CODE_SPACE = len(ALPHABET) ** REF_CODE_LENGTH
+
+# Close to the code space times the golden ratio, so consecutive values land
+# far apart, and sharing no factor with 36, which keeps the map one-to-one
+MULTIPLIER = 81346686631693729
+OFFSET = 52861315924081339
+
+REF_CODE_SEQUENCE = "article_ref_code_seq"
+
+
+def encode_ref_code(value):
+    value = (value * MULTIPLIER + OFFSET) % CODE_SPACE
+    digits = []
+    for _ in range(REF_CODE_LENGTH):
+        value, digit = divmod(value, len(ALPHABET))
+        digits.append(ALPHABET[digit])
+    return "".join(reversed(digits))
+
+
+def next_values(count):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(%s) FROM generate_series(1, %s)",
+            [REF_CODE_SEQUENCE, count],
+        )
+        return [value for (value,) in cursor.fetchall()]
+
+
+def allocate_ref_codes(count):
+    """
+    Reserve a block of ``count`` codes with a single query, for bulk inserts.
+    """
+    if count < 1:
+        return []
+    return [encode_ref_code(value) for value in next_values(count)]
+
+
+def next_ref_code():
+    return allocate_ref_codes(1)[0]
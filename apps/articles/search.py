@@ -0,0 +1,217 @@
+import hashlib
+import time
+from collections.abc import Mapping
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.core.cache import cache
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+
+from .exceptions import InvalidArticleSearch
+from .models import Article
+
+ANY = "Any"
+
+PRICE_LABELS = [
+    ANY,
+    "€0+",
+    "€50,00+",
+    "€100,00+",
+    "€150,00+",
+    "€200,00+",
+    "€250,00+",
+    "€300,00+",
+    "€350,00+",
+    "€400,00+",
+    "€450,00+",
+    "€500,00+",
+]
+TOTAL_WORDS_LABELS = ["0+", "10+"] + [f"{n}+" for n in range(100, 501, 50)]
+COUNT_LABELS = [f"{n}+" for n in range(11)]
+
+PHRASE = "phrase"
+TRIGRAM_MIN_LENGTH = 3
+
+SEARCH_CACHE_GENERATION_KEY = "articles:search:generation"
+
+# Range of the PostgreSQL integer columns that counts are compared with
+MIN_COUNT, MAX_COUNT = -(2**31), 2**31 - 1
+
+
+def to_number(value):
+    number = Decimal(value)
+    if not number.is_finite():
+        raise ValueError(f"{value} is not a finite number")
+    return number
+
+
+def to_price(value):
+    """A price within what the ``price`` column can hold."""
+    field = Article._meta.get_field("price")
+    price = to_number(value).quantize(Decimal(1).scaleb(-field.decimal_places))
+    if abs(price) >= Decimal(10) ** (field.max_digits - field.decimal_places):
+        raise ValueError(f"{value} is out of range")
+    return price
+
+
+def to_count(value):
+    """A count within the range of the integer columns it is compared with."""
+    count = int(to_number(value))
+    if not MIN_COUNT <= count <= MAX_COUNT:
+        raise ValueError(f"{value} is out of range")
+    return count
+
+
+def to_text(value):
+    return str(value).strip().lower()
+
+
+class ChoiceCast:
+    """
+    Map a value to the canonical value of a ``TextChoices`` enum, matching
+    its values and labels regardless of case and spacing, so that filters
+    on choice columns can be exact, indexable equalities.
+    """
+
+    def __init__(self, choices):
+        self.choices = choices
+        self.canonical = {}
+        for value, label in choices.choices:
+            self.canonical[self.normalize(value)] = value
+            self.canonical[self.normalize(label)] = value
+
+    @staticmethod
+    def normalize(value):
+        return " ".join(to_text(value).split())
+
+    def __call__(self, value):
+        normalized = self.normalize(value)
+        if not normalized:
+            return normalized
+        try:
+            return self.canonical[normalized]
+        except KeyError:
+            raise ValueError(
+                f"'{value}' is not one of {', '.join(self.choices.values)}"
+            )
+
+
+class SearchField:
+    """
+    One search form input and the lookup it compiles to.
+
+    Bucket labels such as ``"€50,00+"`` or ``"3+"`` are parsed into their
+    thresholds once, when the table is built, so compiling a request is a
+    dictionary lookup per field. Values that are not in the table are cast
+    directly, which keeps plain numbers working for API clients.
+    """
+
+    def __init__(self, name, lookup, cast, labels=None):
+        self.name = name
+        self.lookup = lookup
+        self.cast = cast
+        self.buckets = {}
+        for label in labels or []:
+            threshold = None
+            if label != ANY:
+                threshold = cast(label.strip("€+").replace(",", "."))
+            self.buckets[label] = threshold
+
+    def compile(self, value):
+        if value is None:
+            return None
+        if isinstance(value, str) and value in self.buckets:
+            return self.buckets[value]
+        try:
+            return self.cast(value)
+        except (InvalidOperation, OverflowError, TypeError, ValueError):
+            raise InvalidArticleSearch(f"'{value}' is not a valid {self.name}")
+
+
+SEARCH_FIELDS = [
+    SearchField("advert_type", "advert_type", ChoiceCast(Article.AdvertType), [ANY]),
+    SearchField("article_type", "article_type", ChoiceCast(Article.ArticleType), [ANY]),
+    SearchField("price", "price__gte", to_price, PRICE_LABELS),
+    SearchField("total_words", "total_words__gte", to_count, TOTAL_WORDS_LABELS),
+    SearchField("paragraphs", "paragraphs__gte", to_count, COUNT_LABELS),
+    SearchField("subtitles", "subtitles__gte", to_count, COUNT_LABELS),
+    SearchField("keywords", "keywords__gte", to_count, COUNT_LABELS),
+    SearchField("catch_phrase", PHRASE, to_text),
+]
+
+
+def compile_search(data):
+    """
+    Compile search form data into a canonical, hashable tuple of
+    ``(lookup, value)`` pairs. Fields that are missing, "Any" or empty do not
+    constrain the search and are left out, so equivalent searches compile to
+    the same tuple.
+    """
+    if not isinstance(data, Mapping):
+        raise InvalidArticleSearch("Expected an object of search fields")
+
+    search = []
+    for field in SEARCH_FIELDS:
+        value = field.compile(data.get(field.name))
+        if value is None or value == "":
+            continue
+        search.append((field.lookup, value))
+    return tuple(sorted(search))
+
+
+def rank_by_phrase(queryset, phrase):
+    """
+    Match ``phrase`` against the title and description and order the matches
+    by relevance. Whole words go through the full-text index; partial words
+    are picked up by trigram word similarity. Phrases too short to have any
+    trigrams fall back to a substring match.
+    """
+    phrase = " ".join(phrase.split())
+    if len(phrase) < TRIGRAM_MIN_LENGTH:
+        return queryset.filter(
+            Q(title__icontains=phrase) | Q(description__icontains=phrase)
+        )
+
+    query = SearchQuery(
+        phrase, config=settings.ARTICLE_SEARCH_CONFIG, search_type="websearch"
+    )
+    return (
+        queryset.filter(
+            Q(search_vector=query)
+            | Q(title__trigram_word_similar=phrase)
+            | Q(description__trigram_word_similar=phrase)
+        )
+        .annotate(
+            rank=SearchRank(F("search_vector"), query)
+            + Greatest(
+                TrigramWordSimilarity(phrase, "title"),
+                TrigramWordSimilarity(phrase, "description"),
+            )
+        )
+        .order_by("-rank", "-pkid")
+    )
+
+
+def filter_articles(queryset, search):
+    lookups = dict(search)
+    phrase = lookups.pop(PHRASE, None)
+    queryset = queryset.filter(**lookups)
+    if phrase:
+        queryset = rank_by_phrase(queryset, phrase)
+    return queryset
+
+
+def search_cache_key(search, page=()):
+    generation = cache.get_or_set(SEARCH_CACHE_GENERATION_KEY, time.time_ns(), None)
+    digest = hashlib.sha1(repr((search, page)).encode()).hexdigest()
+    return f"articles:search:page:{generation}:{digest}"
+
+
+def invalidate_search_cache():
+    cache.set(SEARCH_CACHE_GENERATION_KEY, time.time_ns(), None)
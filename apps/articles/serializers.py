@@ -1,10 +1,82 @@
+from django.contrib.auth import get_user_model
+from django.db.models.fields.files import FieldFile
 from django_countries.serializer_fields import CountryField
 from rest_framework import serializers
 
+from .exceptions import InvalidFieldSelection
+from .images import IMAGE_FIELDS
 from .models import Article, ArticleViews
 
+User = get_user_model()
 
-class ArticleSerializer(serializers.ModelSerializer):
+
+class SparseFieldsMixin:
+    """
+    Lets clients pick the fields they need with ``?fields=title,slug,price``.
+
+    Without a selection the serializer emits ``Meta.default_fields``, or
+    every field when that is not set. ``Meta.field_sources`` names the
+    columns behind fields that are not a column of the same name, so that
+    ``load_only`` can narrow the query to the fields being serialized.
+    """
+
+    fields_query_param = "fields"
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is None:
+            fields = getattr(self.Meta, "default_fields", None)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def parse_fields(cls, query_params):
+        value = query_params.get(cls.fields_query_param, "")
+        fields = [name.strip() for name in value.split(",") if name.strip()]
+        if not fields:
+            return None
+
+        unknown = sorted(set(fields) - set(cls.Meta.fields))
+        if unknown:
+            raise InvalidFieldSelection(f"Unknown fields: {', '.join(unknown)}")
+        return fields
+
+    @classmethod
+    def load_only(cls, queryset, fields=None, extra=()):
+        if fields is None:
+            fields = getattr(cls.Meta, "default_fields", cls.Meta.fields)
+        sources = getattr(cls.Meta, "field_sources", {})
+        columns = [column for name in fields for column in sources.get(name, [name])]
+        # A deferred relation can't be followed with select_related, so keep
+        # joining only the relations the selected fields read from
+        related = {column.split("__")[0] for column in columns if "__" in column}
+        queryset = queryset.select_related(None)
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*columns, *extra)
+
+
+class ImageVariantField(serializers.ImageField):
+    """
+    The URL of a resized variant of an article image, or of the original
+    while the variant has not been generated yet.
+    """
+
+    def __init__(self, variant, **kwargs):
+        self.variant = variant
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        file = super().get_attribute(instance)
+        name = instance.image_variants.get(self.field_name, {}).get(self.variant)
+        if file and name:
+            return FieldFile(instance, file.field, name)
+        return file
+
+
+class ArticleSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     user = serializers.SerializerMethodField()
     country = CountryField(name_only=True)
 
@@ -38,17 +110,126 @@ class ArticleSerializer(serializers.ModelSerializer):
             "views",
             "final_article_title",
         ]
+        read_only_fields = ["ref_code"]
+        field_sources = {
+            "user": ["user__username"],
+            "final_article_title": ["price", "tax"],
+        }
 
     def get_user(self, obj):
         return obj.user.username
 
 
+class ArticleListSerializer(ArticleSerializer):
+    """
+    What a listing row shows: no description, word statistics, gallery
+    photos or computed price, unless asked for with ``?fields=``. Images are
+    the thumbnail variants.
+    """
+
+    cover_photo = ImageVariantField("thumbnail")
+    photo1 = ImageVariantField("thumbnail")
+    photo2 = ImageVariantField("thumbnail")
+    photo3 = ImageVariantField("thumbnail")
+    photo4 = ImageVariantField("thumbnail")
+
+    class Meta(ArticleSerializer.Meta):
+        field_sources = {
+            **ArticleSerializer.Meta.field_sources,
+            **{name: [name, "image_variants"] for name in IMAGE_FIELDS},
+        }
+        default_fields = [
+            "id",
+            "user",
+            "title",
+            "slug",
+            "country",
+            "price",
+            "advert_type",
+            "article_type",
+            "cover_photo",
+            "published_status",
+            "views",
+        ]
+
+
 class ArticleCreateSerializer(serializers.ModelSerializer):
     country = CountryField(name_only=True)
 
     class Meta:
         model = Article
         exclude = ["updated_at", "pkid"]
+        read_only_fields = ["ref_code"]
+
+
+class ArticleBulkSerializer(ArticleCreateSerializer):
+    """
+    ArticleCreateSerializer for the bulk endpoints. The author is always the
+    requesting user.
+    """
+
+    class Meta(ArticleCreateSerializer.Meta):
+        exclude = ArticleCreateSerializer.Meta.exclude + ["user"]
+
+
+class BatchUserField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves users from the ``users`` dict in the serializer context, loaded
+    with one query per batch, instead of one query per row.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("queryset", User.objects.all())
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        try:
+            return self.context["users"][int(data)]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
+class ArticleImportSerializer(ArticleCreateSerializer):
+    """
+    ArticleCreateSerializer for ``import_articles``. Slugs and reference
+    codes are assigned on import, and images are given by their stored name
+    rather than uploaded.
+    """
+
+    user = BatchUserField()
+    cover_photo = serializers.CharField(max_length=100, required=False)
+    photo1 = serializers.CharField(max_length=100, required=False)
+    photo2 = serializers.CharField(max_length=100, required=False)
+    photo3 = serializers.CharField(max_length=100, required=False)
+    photo4 = serializers.CharField(max_length=100, required=False)
+
+    class Meta(ArticleCreateSerializer.Meta):
+        exclude = None
+        fields = [
+            "user",
+            "title",
+            "description",
+            "country",
+            "article_number",
+            "price",
+            "tax",
+            "words",
+            "total_words",
+            "paragraphs",
+            "subtitles",
+            "keywords",
+            "advert_type",
+            "article_type",
+            "cover_photo",
+            "photo1",
+            "photo2",
+            "photo3",
+            "photo4",
+            "published_status",
+            "views",
+        ]
 
 
 class ArticleViewSerializer(serializers.ModelSerializer):
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.articles.caching import invalidate_response_cache
+from apps.articles.models import Article
+from apps.articles.search import invalidate_search_cache
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def invalidate_article_caches(sender, instance, **kwargs):
+    invalidate_search_cache()
+    invalidate_response_cache()
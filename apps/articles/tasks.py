@@ -0,0 +1,22 @@
+from apps.tasks.queue import task
+
+from .images import IMAGE_FIELDS, generate_variants
+from .models import Article
+
+
+@task
+def generate_image_variants(article_id, fields):
+    try:
+        generate_variants(article_id, fields)
+    except Article.DoesNotExist:
+        # Deleted before its turn came; there is nothing left to resize
+        pass
+
+
+def schedule_variants(article_id, fields=IMAGE_FIELDS):
+    """
+    Generate the variants in the background. The task is queued as part of
+    the current transaction, so it only runs once the uploaded originals
+    are committed.
+    """
+    generate_image_variants.enqueue(article_id, list(fields))
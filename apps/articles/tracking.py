@@ -0,0 +1,140 @@
+import atexit
+import logging
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection, transaction
+
+from .models import Article, ArticleViews
+
+logger = logging.getLogger(__name__)
+
+
+def get_client_ip(request):
+    x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if x_forwarded_for:
+        return x_forwarded_for.split(",")[0].strip()
+    return request.META.get("REMOTE_ADDR")
+
+
+class ArticleViewBuffer:
+    """
+    Collects (article, ip) hits in memory and writes them behind the request.
+
+    Hits are deduplicated in the buffer and flushed in bulk, either when the
+    buffer grows past ``max_size`` or when ``flush_interval`` seconds have
+    passed since the last flush. A timer thread flushes hits left behind when
+    no further request comes in, so an idle worker doesn't hold them. A flush inserts the ``ArticleViews`` rows with
+    ``ON CONFLICT DO NOTHING`` and bumps each article's counter by the number
+    of rows actually inserted with one ``F("views") + n`` update.
+    """
+
+    def __init__(self, enabled=True, flush_interval=30, max_size=1000):
+        self.enabled = enabled
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._flushing = False
+        self._last_flush = time.monotonic()
+        self._timer = None
+
+    def add(self, article_id, ip):
+        with self._lock:
+            self._pending.add((article_id, ip))
+            due = (
+                len(self._pending) >= self.max_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+            if due and not self._flushing:
+                self._flushing = True
+            else:
+                due = False
+                self._schedule_flush()
+
+        if due:
+            threading.Thread(target=self._flush_in_background, daemon=True).start()
+
+    def _schedule_flush(self):
+        # Called with the lock held
+        if self._pending and self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_on_timer(self):
+        with self._lock:
+            self._timer = None
+            if self._flushing:
+                # The running flush schedules another timer if need be
+                return
+            self._flushing = True
+        self._flush_in_background()
+
+    def _flush_in_background(self):
+        try:
+            self.flush()
+        finally:
+            connection.close()
+            with self._lock:
+                self._flushing = False
+                self._schedule_flush()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, set()
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        try:
+            return self._write(pending)
+        except Exception:
+            logger.exception(f"flushing {len(pending)} article view(s) failed")
+            with self._lock:
+                self._pending |= pending
+            return 0
+
+    def _write(self, pending):
+        with transaction.atomic():
+            counts = ArticleViews.objects.record(pending)
+            for article_id, count in counts.items():
+                Article.objects.increment_views(article_id, count)
+
+        total = sum(counts.values())
+        logger.info(f"flushed {total} article view(s) for {len(counts)} article(s)")
+        return total
+
+
+def _build_buffer():
+    options = getattr(settings, "ARTICLE_VIEWS_BUFFER", {})
+    return ArticleViewBuffer(
+        enabled=options.get("ENABLED", True),
+        flush_interval=options.get("FLUSH_INTERVAL", 30),
+        max_size=options.get("MAX_SIZE", 1000),
+    )
+
+
+view_buffer = _build_buffer()
+atexit.register(view_buffer.flush)
+
+
+def record_view(article_id, ip):
+    if view_buffer.enabled:
+        view_buffer.add(article_id, ip)
+        return
+
+    with transaction.atomic():
+        if ArticleViews.objects.record([(article_id, ip)]):
+            Article.objects.increment_views(article_id)
+
+
+async def arecord_view(article_id, ip):
+    if view_buffer.enabled:
+        view_buffer.add(article_id, ip)
+        return
+
+    await sync_to_async(record_view)(article_id, ip)
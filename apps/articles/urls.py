@@ -1,6 +1,6 @@
 from django.urls import path
 
-from . import views
+from . import async_views, views
 
 urlpatterns = [
     path("all/", views.ListAllArticlesAPIView.as_view(), name="all-articles"),
@@ -14,4 +14,15 @@ urlpatterns = [
     path("update/<slug:slug>/", views.update_article_api_view, name="update-article"),
     path("delete/<slug:slug>/", views.delete_article_api_view, name="delete-article"),
     path("search/", views.ArticleSearchAPIView.as_view(), name="article-search"),
+    path("upload-image/", views.uploadArticleImage, name="article-upload-image"),
+    path("bulk/create/", views.bulk_create_articles_api_view, name="bulk-create"),
+    path("bulk/update/", views.bulk_update_articles_api_view, name="bulk-update"),
+    path("bulk/delete/", views.bulk_delete_articles_api_view, name="bulk-delete"),
+    path("async/all/", async_views.list_articles, name="async-all-articles"),
+    path(
+        "async/details/<slug:slug>/",
+        async_views.article_detail,
+        name="async-article-details",
+    ),
+    path("async/search/", async_views.search_articles, name="async-article-search"),
 ]
@@ -1,31 +1,81 @@
 import logging
 
 import django_filters
+from django import forms
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils.functional import cached_property
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .exceptions import ArticleNotFound
+from apps.common.renderers import dumps
+
+from .bulk import bulk_insert_articles, bulk_update_articles
+from .caching import cache_response, cached_response, response_cache_key
+from .exceptions import ArticleNotFound, InvalidBulkRequest
+from .images import IMAGE_FIELDS
 from .models import Article, ArticleViews
-from .pagination import ArticlePagination
-from .serializers import (ArticleCreateSerializer, ArticleSerializer,
-                          ArticleViewSerializer)
+from .pagination import ArticleKeysetPagination, ArticlePagination
+from .search import (
+    ChoiceCast,
+    compile_search,
+    filter_articles,
+    rank_by_phrase,
+    search_cache_key,
+)
+from .serializers import (
+    ArticleBulkSerializer,
+    ArticleCreateSerializer,
+    ArticleListSerializer,
+    ArticleSerializer,
+    ArticleViewSerializer,
+)
+from .tasks import schedule_variants
+from .tracking import get_client_ip, record_view
 
 # Create your views here.
 
 logger = logging.getLogger(__name__)
 
 
+class ChoiceValueField(forms.CharField):
+    def __init__(self, *args, choices, **kwargs):
+        self.cast = ChoiceCast(choices)
+        super().__init__(*args, **kwargs)
+
+    def to_python(self, value):
+        value = super().to_python(value)
+        try:
+            return self.cast(value)
+        except ValueError as exc:
+            raise ValidationError(str(exc), code="invalid_choice")
+
+
+class ChoiceValueFilter(django_filters.CharFilter):
+    """
+    Exact match on a ``TextChoices`` column. The value is matched to a
+    choice case-insensitively when the query string is parsed, and unknown
+    values are rejected, so the query is a plain equality the column's
+    indexes can serve rather than ``UPPER(column) = UPPER(value)``.
+    """
+
+    field_class = ChoiceValueField
+
+
 class ArticleFilter(django_filters.FilterSet):
 
-    advert_type = django_filters.CharFilter(
-        field_name="advert_type", lookup_expr="iexact"
+    advert_type = ChoiceValueFilter(
+        field_name="advert_type", choices=Article.AdvertType
     )
 
-    article_type = django_filters.CharFilter(
-        field_name="article_type", lookup_expr="iexact"
+    article_type = ChoiceValueFilter(
+        field_name="article_type", choices=Article.ArticleType
     )
 
     price = django_filters.NumberFilter()
@@ -37,13 +87,48 @@ class ArticleFilter(django_filters.FilterSet):
         fields = ["advert_type", "article_type", "price"]
 
 
-class ListAllArticlesAPIView(generics.ListAPIView):
-    serializer_class = ArticleSerializer
-    queryset = Article.objects.all().order_by("-created_at")
+class ArticleFullTextSearchFilter(filters.BaseFilterBackend):
+    """
+    Ranked full-text search over title and description with ``?q=``.
+    """
+
+    search_param = "q"
+
+    def filter_queryset(self, request, queryset, view):
+        phrase = request.query_params.get(self.search_param, "").strip()
+        if not phrase:
+            return queryset
+        return rank_by_phrase(queryset, phrase)
+
+
+class ArticleFieldSelectionMixin:
+    """
+    Serialize the listing fields, or the ones picked with ``?fields=``, and
+    load only the columns they read.
+    """
+
+    serializer_class = ArticleListSerializer
+
+    @cached_property
+    def selected_fields(self):
+        return self.serializer_class.parse_fields(self.request.query_params)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        return self.serializer_class.load_only(queryset, self.selected_fields)
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self.selected_fields)
+        return super().get_serializer(*args, **kwargs)
+
+
+class ListAllArticlesAPIView(ArticleFieldSelectionMixin, generics.ListAPIView):
+    queryset = Article.objects.select_related("user").order_by("-created_at")
     pagination_class = ArticlePagination
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
+        ArticleFullTextSearchFilter,
         filters.OrderingFilter,
     ]
 
@@ -51,14 +136,25 @@ class ListAllArticlesAPIView(generics.ListAPIView):
     search_fields = ["country"]
     ordering_fields = ["created_at"]
 
+    def list(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+
+        key = response_cache_key(request)
+        entry = cache.get(key)
+        if entry is None:
+            response = super().list(request, *args, **kwargs)
+            entry = cache_response(key, response.data)
+        return cached_response(request, entry)
+
 
-class ListAuthorsArticleAPIView(generics.ListAPIView):
-    serializer_class = ArticleSerializer
-    queryset = Article.objects.all().order_by("-created_at")
+class ListAuthorsArticleAPIView(ArticleFieldSelectionMixin, generics.ListAPIView):
+    queryset = Article.objects.select_related("user").order_by("-created_at")
     pagination_class = ArticlePagination
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
+        ArticleFullTextSearchFilter,
         filters.OrderingFilter,
     ]
 
@@ -68,7 +164,11 @@ class ListAuthorsArticleAPIView(generics.ListAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        queryset = Article.objects.filter(user=user).order_by("-created_at")
+        queryset = (
+            Article.objects.select_related("user")
+            .filter(user=user)
+            .order_by("-created_at")
+        )
 
         return queryset
 
@@ -80,24 +180,28 @@ class ArticleViewsAPIView(generics.ListAPIView):
 
 class ArticleDetailView(APIView):
     def get(self, request, slug):
-        article = Article.objects.get(slug=slug)
-
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(",")[0]
-        else:
-            ip = request.META.get("REMOTE_ADDR")
-
-        if not ArticleViews.objects.filter(article=article, ip=ip).exists():
+        if request.user.is_authenticated:
+            article = self.get_article(slug)
+            record_view(article.pkid, get_client_ip(request))
+            serializer = ArticleSerializer(article, context={"request": request})
+            return Response(serializer.data, status=status.HTTP_200_OK)
 
-            ArticleViews.objects.create(article=article, ip=ip)
+        key = response_cache_key(request)
+        entry = cache.get(key)
+        if entry is None:
+            article = self.get_article(slug)
+            serializer = ArticleSerializer(article, context={"request": request})
+            entry = cache_response(key, serializer.data, pkid=article.pkid)
 
-            article.views += 1
-            article.save()
+        record_view(entry["pkid"], get_client_ip(request))
 
-        serializer = ArticleSerializer(article, context={"request": request})
+        return cached_response(request, entry)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+    def get_article(self, slug):
+        try:
+            return Article.objects.select_related("user").get(slug=slug)
+        except Article.DoesNotExist:
+            raise ArticleNotFound
 
 
 @api_view(["PUT"])
@@ -167,18 +271,158 @@ def delete_article_api_view(request, slug):
         return Response(data=data)
 
 
+NOT_YOUR_ARTICLE = "You can't update or edit an article doesn't belong to you"
+
+
+def get_bulk_items(request):
+    items = request.data
+    if not isinstance(items, list) or not items:
+        raise InvalidBulkRequest
+    if len(items) > settings.ARTICLE_BULK_MAX_ITEMS:
+        raise InvalidBulkRequest(
+            f"At most {settings.ARTICLE_BULK_MAX_ITEMS} articles can be sent at once"
+        )
+    return items
+
+
 @api_view(["POST"])
+@permission_classes([permissions.IsAuthenticated])
+def bulk_create_articles_api_view(request):
+    """
+    Create a list of articles for the requesting user. Nothing is created
+    unless every article is valid; the errors are listed in request order.
+    """
+    items = get_bulk_items(request)
+    serializer = ArticleBulkSerializer(data=items, many=True)
+    if not serializer.is_valid():
+        return Response(
+            {"errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    articles = [
+        Article(user=request.user, **data) for data in serializer.validated_data
+    ]
+    bulk_insert_articles(articles)
+    logger.info(f"{len(articles)} articles created by {request.user.username}")
+
+    serializer = ArticleCreateSerializer(articles, many=True)
+    return Response({"results": serializer.data}, status=status.HTTP_201_CREATED)
+
+
+@api_view(["PATCH"])
+@permission_classes([permissions.IsAuthenticated])
+def bulk_update_articles_api_view(request):
+    """
+    Partially update a list of the requesting user's articles, each given by
+    its ``slug`` along with the fields to change. Nothing is updated unless
+    every change is valid; the errors are listed in request order.
+    """
+    items = get_bulk_items(request)
+    slugs = [item.get("slug") if isinstance(item, dict) else None for item in items]
+    articles = Article.objects.select_related("user").in_bulk(
+        [slug for slug in slugs if isinstance(slug, str)], field_name="slug"
+    )
+
+    errors, updated, retitled, fields = [], {}, {}, set()
+    for item, slug in zip(items, slugs):
+        article = articles.get(slug) if isinstance(slug, str) else None
+        if article is None:
+            errors.append({"slug": [ArticleNotFound.default_detail]})
+            continue
+        if article.user_id != request.user.pk:
+            errors.append({"slug": [NOT_YOUR_ARTICLE]})
+            continue
+
+        serializer = ArticleBulkSerializer(article, data=item, partial=True)
+        if not serializer.is_valid():
+            errors.append(serializer.errors)
+            continue
+
+        for attr, value in serializer.validated_data.items():
+            setattr(article, attr, value)
+        fields.update(serializer.validated_data)
+        updated[article.pkid] = article
+        if "title" in serializer.validated_data:
+            retitled[article.pkid] = article
+        errors.append({})
+
+    if any(errors):
+        return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    articles = list(updated.values())
+    if fields:
+        bulk_update_articles(articles, fields, list(retitled.values()))
+
+    serializer = ArticleSerializer(articles, many=True)
+    return Response({"results": serializer.data})
+
+
+@api_view(["POST"])
+@permission_classes([permissions.IsAuthenticated])
+def bulk_delete_articles_api_view(request):
+    """
+    Delete a list of the requesting user's articles, given by slug. Nothing
+    is deleted unless every article can be; the errors are listed in request
+    order.
+    """
+    slugs = get_bulk_items(request)
+    owners = dict(
+        Article.objects.filter(
+            slug__in=[slug for slug in slugs if isinstance(slug, str)]
+        ).values_list("slug", "user_id")
+    )
+
+    errors = []
+    for slug in slugs:
+        if not isinstance(slug, str) or slug not in owners:
+            errors.append({"slug": [ArticleNotFound.default_detail]})
+        elif owners[slug] != request.user.pk:
+            errors.append({"slug": [NOT_YOUR_ARTICLE]})
+        else:
+            errors.append({})
+
+    if any(errors):
+        return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    with transaction.atomic():
+        _, deleted = Article.objects.filter(slug__in=slugs).delete()
+
+    return Response({"deleted": deleted.get(Article._meta.label, 0)})
+
+
+@api_view(["POST"])
+@permission_classes([permissions.IsAuthenticated])
 def uploadArticleImage(request):
-    data = request.data
-    article_id = data["article_id"]
-    article = Article.objects.get(id=article_id)
-    article.cover_photo = request.FILES.get("cover_photo")
-    article.photo1 = request.FILES.get("photo1")
-    article.photo2 = request.FILES.get("photo2")
-    article.photo3 = request.FILES.get("photo3")
-    article.photo4 = request.FILES.get("photo4")
+    try:
+        article_id = request.data["article_id"]
+    except (KeyError, TypeError):
+        article_id = None
+    if not article_id:
+        errors = {"article_id": ["This field is required."]}
+        return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        article = Article.objects.get(id=article_id)
+    except (Article.DoesNotExist, ValidationError):
+        raise ArticleNotFound
 
-    article.save()
+    if article.user_id != request.user.pk:
+        return Response({"error": NOT_YOUR_ARTICLE}, status=status.HTTP_403_FORBIDDEN)
+
+    # Only the originals are stored here; the resized variants are made in
+    # the background and replace the stale ones when they are ready
+    uploaded = [name for name in IMAGE_FIELDS if name in request.FILES]
+    if uploaded:
+        for name in uploaded:
+            setattr(article, name, request.FILES[name])
+        article.image_variants = {
+            name: variants
+            for name, variants in article.image_variants.items()
+            if name not in uploaded
+        }
+        with transaction.atomic():
+            article.save(update_fields=uploaded + ["image_variants"])
+            schedule_variants(article.pkid, uploaded)
 
     return Response("Image(s) Uploaded!")
 
@@ -186,153 +430,46 @@ def uploadArticleImage(request):
 class ArticleSearchAPIView(APIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = ArticleCreateSerializer
+    pagination_class = ArticleKeysetPagination
+    stream_chunk_size = 500
 
     def post(self, request):
-        queryset = Article.objects.filter(published_status=True)
-        data = self.request.data
-
-        advert_type = data["advert_type"]
-        queryset = queryset.filter(advert_type__iexact=advert_type)
-
-        article_type = data["article_type"]
-        queryset = queryset.filter(article_type__iexact=article_type)
-
-        price = data["price"]
-        if price == "€0+":
-            price = 0
-        elif price == "€50,00+":
-            price = 50
-        elif price == "€100,00+":
-            price = 100
-        elif price == "€150,00+":
-            price = 150
-        elif price == "€200,00+":
-            price = 200
-        elif price == "€250,00+":
-            price = 250
-        elif price == "€300,00+":
-            price = 300
-        elif price == "€350,00+":
-            price = 350
-        elif price == "€400,00+":
-            price = 400
-        elif price == "€450,00+":
-            price = 450
-        elif price == "€500,00+":
-            price = 500
-        elif price == "Any":
-            price = -1
-
-        if price != -1:
-            queryset = queryset.filter(price__gte=price)
-
-        total_words = data["total_words"]
-        if total_words == "0+":
-            total_words = 0
-        elif total_words == "10+":
-            total_words = 10
-        elif total_words == "100+":
-            total_words = 100
-        elif total_words == "150+":
-            total_words = 150
-        elif total_words == "200+":
-            total_words = 200
-        elif total_words == "250+":
-            total_words = 250
-        elif total_words == "300+":
-            total_words = 300
-        elif total_words == "350+":
-            total_words = 350
-        elif total_words == "400+":
-            total_words = 400
-        elif total_words == "450+":
-            total_words = 450
-        elif total_words == "500+":
-            total_words = 500
-
-        queryset = queryset.filter(total_words__gte=total_words)
-
-        paragraphs = data["paragraphs"]
-        if paragraphs == "0+":
-            paragraphs = 0
-        elif paragraphs == "1+":
-            paragraphs = 1
-        elif paragraphs == "2+":
-            paragraphs = 2
-        elif paragraphs == "3+":
-            paragraphs = 3
-        elif paragraphs == "4+":
-            paragraphs = 4
-        elif paragraphs == "5+":
-            paragraphs = 5
-        elif paragraphs == "6+":
-            paragraphs = 6
-        elif paragraphs == "7+":
-            paragraphs = 7
-        elif paragraphs == "8+":
-            paragraphs = 8
-        elif paragraphs == "9+":
-            paragraphs = 9
-        elif paragraphs == "10+":
-            paragraphs = 10
-
-        queryset = queryset.filter(paragraphs__gte=paragraphs)
-
-        subtitles = data["subtitles"]
-        if subtitles == "0+":
-            subtitles = 0
-        elif subtitles == "1+":
-            subtitles = 1
-        elif subtitles == "2+":
-            subtitles = 2
-        elif subtitles == "3+":
-            subtitles = 3
-        elif subtitles == "4+":
-            subtitles = 4
-        elif subtitles == "5+":
-            subtitles = 5
-        elif subtitles == "6+":
-            subtitles = 6
-        elif subtitles == "7+":
-            subtitles = 7
-        elif subtitles == "8+":
-            subtitles = 8
-        elif subtitles == "9+":
-            subtitles = 9
-        elif subtitles == "10+":
-            subtitles = 10
-
-        queryset = queryset.filter(subtitles__gte=subtitles)
-
-        keywords = data["keywords"]
-        if keywords == "0+":
-            keywords = 0
-        elif keywords == "1+":
-            keywords = 1
-        elif keywords == "2+":
-            keywords = 2
-        elif keywords == "3+":
-            keywords = 3
-        elif keywords == "4+":
-            keywords = 4
-        elif keywords == "5+":
-            keywords = 5
-        elif keywords == "6+":
-            keywords = 6
-        elif keywords == "7+":
-            keywords = 7
-        elif keywords == "8+":
-            keywords = 8
-        elif keywords == "9+":
-            keywords = 9
-        elif keywords == "10+":
-            keywords = 10
-
-        queryset = queryset.filter(keywords__gte=keywords)
-
-        catch_phrase = data["catch_phrase"]
-        queryset = queryset.filter(description__icontains=catch_phrase)
-
-        serializer = ArticleSerializer(queryset, many=True)
+        search = compile_search(self.request.data)
+        fields = ArticleListSerializer.parse_fields(request.query_params)
+        queryset = ArticleListSerializer.load_only(
+            filter_articles(Article.published.all(), search),
+            fields,
+            extra=["created_at"],
+        )
 
-        return Response(serializer.data)
+        if request.query_params.get("stream") == "ndjson":
+            return self.stream(queryset, fields)
+
+        paginator = self.pagination_class()
+        page = (
+            request.query_params.get(paginator.cursor_query_param),
+            paginator.get_page_size(request),
+            fields,
+        )
+        cache_key = search_cache_key(search, page)
+
+        state = cache.get(cache_key)
+        if state is None:
+            articles = paginator.paginate_queryset(queryset, request, view=self)
+            data = ArticleListSerializer(articles, many=True, fields=fields).data
+            state = paginator.get_page_state(data)
+            cache.set(cache_key, state, settings.ARTICLE_SEARCH_CACHE_TIMEOUT)
+
+        data = paginator.restore_page_state(request, state)
+        return paginator.get_paginated_response(data)
+
+    def stream(self, queryset, fields):
+        ordering = self.pagination_class().get_ordering(queryset)
+        queryset = queryset.order_by(*ordering)
+
+        def rows():
+            for article in queryset.iterator(chunk_size=self.stream_chunk_size):
+                data = ArticleListSerializer(article, fields=fields).data
+                yield dumps(data) + b"\n"
+
+        return StreamingHttpResponse(rows(), content_type="application/x-ndjson")
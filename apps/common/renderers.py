@@ -0,0 +1,81 @@
+import re
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_OPTIONS = (
+    (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+)
+
+# Values orjson doesn't handle natively, such as Decimal, lazy translations
+# and querysets, are converted the same way DRF's own encoder converts them.
+# So are dates and times, which DRF writes with milliseconds only
+encode_default = encoders.JSONEncoder().default
+
+# orjson writes some floats in another notation than the standard library:
+# 1e16 for 1e+16, 1e-6 for 1e-06 and 0.00001 for 1e-05. Output holding one
+# is encoded again with the standard library. Each pattern starts from a
+# literal, so the scan runs at the speed of a substring search, and only
+# matches a whole number token: an exponent runs up to the next ",", "}",
+# "]" or the end, and 0.0000 follows ":", ",", "[" or "-". Hex digits inside
+# UUID strings match neither
+EXPONENT_FLOAT = re.compile(rb"e(?<=\de)-?\d+(?:[,}\]]|$)")
+SMALL_FLOAT = re.compile(rb"0\.0000(?<=[:,\[-]0\.0000)")
+SMALL_FLOAT_PREFIXES = (b"0.0000", b"-0.0000")
+
+
+def dumps(data):
+    """
+    Encode ``data`` to compact UTF-8 JSON bytes, with orjson when it is
+    installed and the standard library otherwise.
+
+    The result is what ``JSONRenderer`` renders, except that NaN and the
+    infinities are written as ``null`` where ``JSONRenderer`` raises
+    ValueError. Integers beyond 64 bits and floats orjson writes in another
+    notation are left to ``JSONRenderer``.
+    """
+    if orjson is None:
+        return JSONRenderer().render(data)
+
+    try:
+        content = orjson.dumps(data, default=encode_default, option=ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        return JSONRenderer().render(data)
+    if (
+        EXPONENT_FLOAT.search(content)
+        or SMALL_FLOAT.search(content)
+        or content.startswith(SMALL_FLOAT_PREFIXES)
+    ):
+        return JSONRenderer().render(data)
+
+    # Same as JSONRenderer: these are valid JSON but not valid JavaScript
+    if b"\xe2\x80\xa8" in content or b"\xe2\x80\xa9" in content:
+        content = content.replace(b"\xe2\x80\xa8", b"\\u2028")
+        content = content.replace(b"\xe2\x80\xa9", b"\\u2029")
+    return content
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it is installed. Strings,
+    numbers and UUIDs are encoded natively and the result is written
+    straight to bytes, without building an intermediate str.
+
+    Indented output, as asked for by the browsable API, falls back to the
+    standard library encoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return dumps(data)
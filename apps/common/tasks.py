@@ -0,0 +1,17 @@
+from django.core.mail import EmailMultiAlternatives
+
+from apps.tasks.queue import task
+
+
+@task
+def send_email(subject, body, from_email, to, reply_to=None, html=None):
+    """
+    Send an email. Errors are raised rather than silenced so the queue
+    retries the send.
+    """
+    message = EmailMultiAlternatives(
+        subject, body, from_email, to, reply_to=reply_to or []
+    )
+    if html:
+        message.attach_alternative(html, "text/html")
+    message.send()
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Enquiry
+from .models import Enquiry, EnquiryNotification
 
 
 # Register your models here.
@@ -9,3 +9,12 @@ class EnquiryAdmin(admin.ModelAdmin):
 
 
 admin.site.register(Enquiry, EnquiryAdmin)
+
+
+class EnquiryNotificationAdmin(admin.ModelAdmin):
+    list_display = ["subject", "from_email", "status", "attempts", "sent_at"]
+    list_filter = ["status"]
+    readonly_fields = ["last_error"]
+
+
+admin.site.register(EnquiryNotification, EnquiryNotificationAdmin)
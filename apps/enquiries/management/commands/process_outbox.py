@@ -0,0 +1,44 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.enquiries.outbox import deliver_batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Send the queued enquiry notifications in batches over one SMTP "
+        "connection, retrying failures with backoff"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.ENQUIRY_OUTBOX["BATCH_SIZE"]
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.ENQUIRY_OUTBOX["POLL_INTERVAL"],
+            help="Seconds to wait before polling an empty outbox again",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once nothing is due instead of polling",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                close_old_connections()
+                sent, failed = deliver_batch(options["batch_size"])
+                if sent or failed:
+                    self.stdout.write(f"{sent} sent, {failed} failed")
+                elif options["once"]:
+                    break
+                else:
+                    time.sleep(options["poll_interval"])
+        except KeyboardInterrupt:
+            pass
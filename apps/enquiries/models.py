@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from phonenumber_field.modelfields import PhoneNumberField
 
@@ -18,3 +19,42 @@ class Enquiry(TimeStampedUUIDModel):
 
     class Meta:
         verbose_name_plural = "Enqueries"
+
+
+class EnquiryNotification(TimeStampedUUIDModel):
+    """
+    Outbox row for the email that notifies the site about an enquiry. It is
+    written in the same transaction as the enquiry and delivered later by
+    ``manage.py process_outbox``.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        SENT = "sent", _("Sent")
+        FAILED = "failed", _("Failed")
+
+    enquiry = models.OneToOneField(
+        Enquiry, related_name="notification", on_delete=models.CASCADE
+    )
+    subject = models.CharField(_("Subject"), max_length=255)
+    body = models.TextField(_("Body"))
+    from_email = models.CharField(_("From"), max_length=254)
+    recipients = models.JSONField(_("Recipients"), default=list)
+    status = models.CharField(
+        _("Status"), max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveIntegerField(_("Attempts"), default=0)
+    next_attempt_at = models.DateTimeField(_("Next Attempt At"), default=timezone.now)
+    sent_at = models.DateTimeField(_("Sent At"), null=True, blank=True)
+    last_error = models.TextField(_("Last Error"), blank=True)
+
+    def __str__(self) -> str:
+        return f"{self.subject} ({self.status})"
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="enquiries_outbox_due_idx",
+            )
+        ]
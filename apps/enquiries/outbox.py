@@ -0,0 +1,113 @@
+"""
+Delivery of enquiry notifications from the ``EnquiryNotification`` outbox.
+
+The view only writes an outbox row next to the enquiry, so a slow or failing
+mail server never holds up the request. ``manage.py process_outbox`` sends
+the due rows in batches over one SMTP connection and records the outcome of
+each: sent, pending again after a backoff, or failed once it has used up
+``ENQUIRY_OUTBOX["MAX_ATTEMPTS"]``.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from apps.tasks.queue import retry_delay
+
+from .models import EnquiryNotification
+
+logger = logging.getLogger(__name__)
+
+
+def queue_notification(enquiry):
+    return EnquiryNotification.objects.create(
+        enquiry=enquiry,
+        subject=enquiry.subject,
+        body=enquiry.message,
+        from_email=enquiry.email,
+        recipients=[settings.DEFAULT_FROM_EMAIL],
+    )
+
+
+def build_message(notification, connection):
+    return EmailMessage(
+        notification.subject,
+        notification.body,
+        notification.from_email,
+        notification.recipients,
+        connection=connection,
+    )
+
+
+def deliver_batch(batch_size=None, connection=None):
+    """
+    Send up to ``batch_size`` due notifications over a single connection and
+    return how many were sent and how many failed.
+
+    The rows stay locked until their outcome is saved, so concurrent workers
+    skip them instead of sending them twice. If a worker dies mid-batch its
+    transaction rolls back and the batch is sent again, so delivery is at
+    least once.
+    """
+    options = settings.ENQUIRY_OUTBOX
+    batch_size = batch_size or options["BATCH_SIZE"]
+    connection = connection or get_connection()
+    now = timezone.now()
+
+    with transaction.atomic():
+        batch = list(
+            EnquiryNotification.objects.select_for_update(skip_locked=True)
+            .filter(status=EnquiryNotification.Status.PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        if not batch:
+            return 0, 0
+
+        # Each message goes through send_messages on its own so one refused
+        # message doesn't hide whether the rest were delivered, but all of
+        # them share the connection opened here
+        errors = {}
+        try:
+            with connection:
+                for notification in batch:
+                    try:
+                        connection.send_messages(
+                            [build_message(notification, connection)]
+                        )
+                    except Exception as exc:
+                        errors[notification.pkid] = exc
+        except Exception as exc:
+            for notification in batch:
+                errors.setdefault(notification.pkid, exc)
+
+        sent_at = timezone.now()
+        for notification in batch:
+            notification.attempts += 1
+            error = errors.get(notification.pkid)
+            if error is None:
+                notification.status = EnquiryNotification.Status.SENT
+                notification.sent_at = sent_at
+                notification.last_error = ""
+            elif notification.attempts >= options["MAX_ATTEMPTS"]:
+                notification.status = EnquiryNotification.Status.FAILED
+                notification.last_error = repr(error)
+            else:
+                notification.next_attempt_at = sent_at + timedelta(
+                    seconds=retry_delay(notification.attempts)
+                )
+                notification.last_error = repr(error)
+
+        EnquiryNotification.objects.bulk_update(
+            batch,
+            ["status", "attempts", "next_attempt_at", "sent_at", "last_error"],
+        )
+
+    if errors:
+        logger.warning(
+            f"{len(errors)} of {len(batch)} enquiry notifications failed, "
+            f"first error: {next(iter(errors.values()))!r}"
+        )
+    return len(batch) - len(errors), len(errors)
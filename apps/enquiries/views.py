@@ -1,11 +1,10 @@
-from django.core.mail import send_mail
+from django.db import transaction
 from rest_framework import permissions
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 
-from pstore.settings.development import DEFAULT_FROM_EMAIL
-
 from .models import Enquiry
+from .outbox import queue_notification
 
 # Create your views here.
 
@@ -19,17 +18,12 @@ def send_enquiry_email(request):
         name = data["name"]
         email = data["email"]
         message = data["message"]
-        from_email = data["email"]
-        recipient_list = [DEFAULT_FROM_EMAIL]
-        send_mail(
-            subject,
-            message,
-            from_email,
-            recipient_list,
-            fail_silently=True,
-        )
-        enquiry = Enquiry(name=name, email=email, subject=subject, message=message)
-        enquiry.save()
+        # The notification email goes into the outbox in the same
+        # transaction as the enquiry; process_outbox delivers it
+        with transaction.atomic():
+            enquiry = Enquiry(name=name, email=email, subject=subject, message=message)
+            enquiry.save()
+            queue_notification(enquiry)
         return Response({"success": "Your Enquiry was successfully submited"})
     except ValueError as e:
         print("FAIL", e)
@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.profiles.ranking import rank_authors
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the author ranking from ratings, reviews and article views. "
+        "Run it periodically, from cron or with --interval as a service."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            help="Rank the authors again every INTERVAL seconds instead of exiting",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                close_old_connections()
+                ranked = rank_authors()
+                self.stdout.write(self.style.SUCCESS(f"Ranked {ranked} author(s)"))
+                if not options["interval"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
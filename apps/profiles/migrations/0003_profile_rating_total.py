@@ -0,0 +1,43 @@
+# Generated by Django 4.1.2 on 2026-10-18 18:55
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def populate_rating_aggregates(apps, schema_editor):
+    Profile = apps.get_model("profiles", "Profile")
+    Rating = apps.get_model("ratings", "Rating")
+    aggregates = (
+        Rating.objects.filter(author__isnull=False)
+        .values("author")
+        .annotate(count=Count("pkid"), total=Sum("rating"))
+    )
+    for row in aggregates:
+        Profile.objects.filter(pkid=row["author"]).update(
+            num_reviews=row["count"],
+            rating_total=row["total"],
+            rating=(Decimal(row["total"]) / row["count"]).quantize(
+                Decimal("0.01"), ROUND_HALF_UP
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0002_profile_about_me_alter_profile_phone_number"),
+        ("ratings", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="rating_total",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="Sum of Review Ratings"
+            ),
+        ),
+        migrations.RunPython(populate_rating_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.1.2 on 2026-10-18 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0003_profile_rating_total"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="author_rank",
+            field=models.PositiveIntegerField(
+                blank=True, db_index=True, null=True, verbose_name="Author Rank"
+            ),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="rank_score",
+            field=models.FloatField(blank=True, null=True, verbose_name="Rank Score"),
+        ),
+    ]
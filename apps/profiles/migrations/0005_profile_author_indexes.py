@@ -0,0 +1,33 @@
+# Generated by Django 4.1.2 on 2026-10-18 15:54
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Build the indexes without locking the table against writes
+    atomic = False
+
+    dependencies = [
+        ("profiles", "0004_profile_author_rank"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="profile",
+            index=models.Index(
+                condition=models.Q(("is_author", True)),
+                fields=["pkid"],
+                name="profile_author_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="profile",
+            index=models.Index(
+                condition=models.Q(("top_author", True)),
+                fields=["author_rank", "pkid"],
+                name="profile_top_author_rank_idx",
+            ),
+        ),
+    ]
@@ -1,5 +1,9 @@
+from decimal import ROUND_HALF_UP, Decimal
+
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import DecimalField, F, Q
+from django.db.models.functions import Cast, Coalesce, Round
 from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
 from phonenumber_field.modelfields import PhoneNumberField
@@ -17,6 +21,37 @@ class Gender(models.TextChoices):
     OTHER = "Other", _("Other")
 
 
+def average_rating(total, count):
+    """
+    The average of ``count`` reviews adding up to ``total``, rounded half up
+    to two places like PostgreSQL's ``round()`` does in ``add_review()``.
+    """
+    if not count:
+        return None
+    return (Decimal(total) / count).quantize(Decimal("0.01"), ROUND_HALF_UP)
+
+
+class ProfileManager(models.Manager):
+    def add_review(self, profile_id, rating):
+        """
+        Fold a new review into the author's aggregates with a single UPDATE.
+        Every F() in the statement reads the pre-update row, so the average
+        is derived from the new count and total. It is divided and rounded as
+        a numeric, so it matches ``average_rating()``.
+        """
+        num_reviews = Coalesce(F("num_reviews"), 0) + 1
+        rating_total = F("rating_total") + rating
+        return self.filter(pkid=profile_id).update(
+            num_reviews=num_reviews,
+            rating_total=rating_total,
+            rating=Round(
+                Cast(rating_total, DecimalField(max_digits=12, decimal_places=2))
+                / num_reviews,
+                2,
+            ),
+        )
+
+
 class Profile(TimeStampedUUIDModel):
     user = models.OneToOneField(User, related_name="profile", on_delete=models.CASCADE)
     phone_number = PhoneNumberField(
@@ -65,6 +100,29 @@ class Profile(TimeStampedUUIDModel):
     num_reviews = models.IntegerField(
         verbose_name=_("Number of Reviews"), default=0, null=True, blank=True
     )
+    rating_total = models.IntegerField(
+        verbose_name=_("Sum of Review Ratings"), default=0, editable=False
+    )
+    author_rank = models.PositiveIntegerField(
+        verbose_name=_("Author Rank"), null=True, blank=True, db_index=True
+    )
+    rank_score = models.FloatField(verbose_name=_("Rank Score"), null=True, blank=True)
+
+    objects = ProfileManager()
 
     def __str__(self):
         return f"{self.user.username}'s profile"
+
+    class Meta:
+        # Authors and top authors are a small share of all profiles, so
+        # partial indexes over just those rows stay small
+        indexes = [
+            models.Index(
+                fields=["pkid"], condition=Q(is_author=True), name="profile_author_idx"
+            ),
+            models.Index(
+                fields=["author_rank", "pkid"],
+                condition=Q(top_author=True),
+                name="profile_top_author_rank_idx",
+            ),
+        ]
@@ -0,0 +1,74 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from apps.articles.models import Article
+
+from .models import Profile
+
+TOP_AUTHORS_GENERATION_KEY = "profiles:top-authors:generation"
+
+# Weights of the author score. The review count and article views are
+# log-damped so a handful of viral articles can't outrank consistently
+# well-rated authors.
+RATING_WEIGHT = 2.0
+REVIEWS_WEIGHT = 1.0
+VIEWS_WEIGHT = 0.5
+
+
+def rank_authors():
+    """
+    Score and rank every author in one set-based statement and flag the
+    best ``TOP_AUTHORS_COUNT`` of them as top authors. Returns the number of
+    ranked authors.
+    """
+    profiles = connection.ops.quote_name(Profile._meta.db_table)
+    articles = connection.ops.quote_name(Article._meta.db_table)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH scores AS (
+                SELECT p.pkid,
+                       COALESCE(p.rating, 0) * %s
+                       + LN(1 + COALESCE(p.num_reviews, 0)) * %s
+                       + LN(1 + COALESCE(a.views, 0)) * %s AS score
+                FROM {profiles} AS p
+                LEFT JOIN (
+                    SELECT user_id, SUM(views) AS views
+                    FROM {articles}
+                    GROUP BY user_id
+                ) a ON a.user_id = p.user_id
+                WHERE p.is_author
+            ),
+            ranked AS (
+                SELECT pkid, score,
+                       ROW_NUMBER() OVER (ORDER BY score DESC, pkid) AS position
+                FROM scores
+            )
+            UPDATE {profiles} AS p
+            SET author_rank = ranked.position,
+                rank_score = ranked.score,
+                top_author = ranked.position <= %s
+            FROM ranked
+            WHERE p.pkid = ranked.pkid
+            """,
+            [RATING_WEIGHT, REVIEWS_WEIGHT, VIEWS_WEIGHT, settings.TOP_AUTHORS_COUNT],
+        )
+        Profile.objects.filter(is_author=False, author_rank__isnull=False).update(
+            author_rank=None, rank_score=None, top_author=False
+        )
+
+    invalidate_top_authors()
+    return Profile.objects.filter(author_rank__isnull=False).count()
+
+
+def top_authors_cache_key(*parts):
+    generation = cache.get_or_set(TOP_AUTHORS_GENERATION_KEY, time.time_ns(), None)
+    return ":".join(["profiles:top-authors", str(generation), *map(str, parts)])
+
+
+def invalidate_top_authors():
+    cache.set(TOP_AUTHORS_GENERATION_KEY, time.time_ns(), None)
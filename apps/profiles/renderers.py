@@ -1,9 +1,7 @@
-import json
+from apps.common.renderers import FastJSONRenderer
 
-from rest_framework.renderers import JSONRenderer
 
-
-class ProfileJSONRenderer(JSONRenderer):
+class ProfileJSONRenderer(FastJSONRenderer):
     charset = "utf-8"
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
@@ -12,4 +10,6 @@ class ProfileJSONRenderer(JSONRenderer):
         if errors is not None:
             return super(ProfileJSONRenderer, self).render(data)
 
-        return json.dumps({"profile": data})
+        return super(ProfileJSONRenderer, self).render(
+            {"profile": data}, accepted_media_type, renderer_context
+        )
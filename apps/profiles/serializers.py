@@ -77,6 +77,14 @@ class UpdateProfileSerializer(serializers.ModelSerializer):
             "is_author",
         ]
 
+    def update(self, instance, validated_data):
+        # Write only the submitted columns, so the review and ranking
+        # aggregates maintained with update() are never overwritten
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
+
     def to_representation(self, instance):
         representation = super().to_representation(instance)
 
@@ -1,7 +1,11 @@
 from django.urls import path
 
-from .views import (AuthorListAPIView, GetProfileAPIView,
-                    TopAuthorsListAPIView, UpdateProfileAPIView)
+from .views import (
+    AuthorListAPIView,
+    GetProfileAPIView,
+    TopAuthorsListAPIView,
+    UpdateProfileAPIView,
+)
 
 urlpatterns = [
     path("me/", GetProfileAPIView.as_view(), name="get_profile"),
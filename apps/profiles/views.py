@@ -1,18 +1,31 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.ratings.models import Rating
+
 from .exceptions import NotYourProfile, ProfileNotFound
 from .models import Profile
+from .pagination import TopAuthorsPagination
+from .ranking import top_authors_cache_key
 from .renderers import ProfileJSONRenderer
 from .serializers import ProfileSerializer, UpdateProfileSerializer
 
 # Create your views here.
 
 
+def profiles_with_reviews():
+    return Profile.objects.select_related("user").prefetch_related(
+        Prefetch("author_review", queryset=Rating.objects.select_related("rater"))
+    )
+
+
 class AuthorListAPIView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
-    queryset = Profile.objects.filter(is_author=True)
+    queryset = profiles_with_reviews().filter(is_author=True)
     serializer_class = ProfileSerializer
 
 
@@ -31,8 +44,25 @@ class AuthorListAPIView(generics.ListAPIView):
 
 class TopAuthorsListAPIView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
-    queryset = Profile.objects.filter(top_author=True)
+    queryset = (
+        profiles_with_reviews().filter(top_author=True).order_by("author_rank", "pkid")
+    )
     serializer_class = ProfileSerializer
+    pagination_class = TopAuthorsPagination
+
+    def list(self, request, *args, **kwargs):
+        paginator = self.paginator
+        cache_key = top_authors_cache_key(
+            request.query_params.get(paginator.page_query_param, 1),
+            paginator.get_page_size(request),
+        )
+
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, settings.TOP_AUTHORS_CACHE_TIMEOUT)
+
+        return Response(data)
 
 
 class GetProfileAPIView(APIView):
@@ -41,7 +71,7 @@ class GetProfileAPIView(APIView):
 
     def get(self, request):
         user = self.request.user
-        user_profile = Profile.objects.get(user=user)
+        user_profile = profiles_with_reviews().get(user=user)
         serializer = ProfileSerializer(user_profile, context={"request": request})
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -54,7 +84,7 @@ class UpdateProfileAPIView(APIView):
 
     def patch(self, request, username):
         try:
-            Profile.objects.get(user__username=username)
+            profile = Profile.objects.get(user__username=username)
         except Profile.DoesNotExist:
             raise ProfileNotFound
 
@@ -63,11 +93,9 @@ class UpdateProfileAPIView(APIView):
             raise NotYourProfile
 
         data = request.data
-        serializer = UpdateProfileSerializer(
-            instance=request.user.profile, data=data, partial=True
-        )
+        serializer = UpdateProfileSerializer(instance=profile, data=data, partial=True)
 
-        serializer.is_valid()
+        serializer.is_valid(raise_exception=True)
         serializer.save()
 
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from apps.profiles.models import Profile, average_rating
+from apps.ratings.models import Rating
+
+
+class Command(BaseCommand):
+    help = "Rebuild the review count, rating total and average of every profile"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of profiles written per UPDATE statement",
+        )
+
+    def handle(self, *args, **options):
+        aggregates = {
+            row["author"]: (row["count"], row["total"])
+            for row in Rating.objects.filter(author__isnull=False)
+            .values("author")
+            .annotate(count=Count("pkid"), total=Sum("rating"))
+        }
+
+        drifted = []
+        profiles = Profile.objects.only("pkid", "num_reviews", "rating_total", "rating")
+        for profile in profiles.iterator():
+            count, total = aggregates.get(profile.pkid, (0, 0))
+            rating = average_rating(total, count)
+            if (profile.num_reviews, profile.rating_total, profile.rating) == (
+                count,
+                total,
+                rating,
+            ):
+                continue
+
+            profile.num_reviews = count
+            profile.rating_total = total
+            profile.rating = rating
+            drifted.append(profile)
+
+        with transaction.atomic():
+            Profile.objects.bulk_update(
+                drifted,
+                ["num_reviews", "rating_total", "rating"],
+                batch_size=options["batch_size"],
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"Repaired {len(drifted)} profile(s)"))
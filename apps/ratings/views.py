@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from rest_framework import permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
@@ -23,9 +24,7 @@ def create_author_review(request, profile_id):
         formatted_response = {"message": "you can't rate yourself"}
         return Response(formatted_response, status=status.HTTP_403_FORBIDDEN)
 
-    already_exists = author_profile.author_review.filter(
-        author__pkid=profile_user.pkid
-    ).exists()
+    already_exists = author_profile.author_review.filter(rater=request.user).exists()
     if already_exists:
         formatted_response = {"detail": "Profile already reviewed"}
         return Response(formatted_response, status=status.HTTP_400_BAD_REQUEST)
@@ -33,17 +32,13 @@ def create_author_review(request, profile_id):
         formatted_response = {"detail": "Please select a rating"}
         return Response(formatted_response, status=status.HTTP_400_BAD_REQUEST)
     else:
-        review = Rating.objects.create(
-            rater=request.user,
-            author=author_profile,
-            rating=data["rating"],
-            comment=data["comment"],
-        )
-
-        reviews = author_profile.author_review.all()
-        author_profile.num_reviews = len(reviews)
-        total = 0
-        for i in reviews:
-            total += i.rating
+        with transaction.atomic():
+            review = Rating.objects.create(
+                rater=request.user,
+                author=author_profile,
+                rating=data["rating"],
+                comment=data["comment"],
+            )
+            Profile.objects.add_review(author_profile.pkid, int(review.rating))
 
         return Response("Review Added")
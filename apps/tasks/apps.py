@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class TasksConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.tasks"
+
+    def ready(self):
+        # Register the tasks defined in every app's tasks.py, so a worker
+        # can look them up by name
+        autodiscover_modules("tasks")
@@ -0,0 +1,77 @@
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from apps.tasks.models import QueuedTask
+from apps.tasks.queue import claim_tasks, run_task
+
+
+class Command(BaseCommand):
+    help = "Run the tasks queued in the database, retrying failures with backoff"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.TASKS["WORKERS"],
+            help="Tasks run at the same time by this process",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.TASKS["POLL_INTERVAL"],
+            help="Seconds to wait before polling an empty queue again",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no task is due instead of polling",
+        )
+        parser.add_argument(
+            "--purge",
+            type=int,
+            metavar="DAYS",
+            help="Delete finished tasks last scheduled more than DAYS days ago and exit",
+        )
+
+    def handle(self, *args, **options):
+        if options["purge"] is not None:
+            cutoff = timezone.now() - timedelta(days=options["purge"])
+            deleted, _ = QueuedTask.objects.filter(
+                status__in=[QueuedTask.Status.DONE, QueuedTask.Status.FAILED],
+                run_at__lt=cutoff,
+            ).delete()
+            self.stdout.write(f"Deleted {deleted} finished tasks")
+            return
+
+        workers = options["workers"]
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="run-tasks"
+        ) as executor:
+            try:
+                while True:
+                    close_old_connections()
+                    claimed = claim_tasks(workers)
+                    if claimed:
+                        outcomes = Counter(executor.map(self.run, claimed))
+                        self.stdout.write(
+                            ", ".join(f"{n} {status}" for status, n in outcomes.items())
+                        )
+                    elif options["once"]:
+                        break
+                    else:
+                        time.sleep(options["poll_interval"])
+            except KeyboardInterrupt:
+                pass
+
+    def run(self, queued):
+        try:
+            return run_task(queued)
+        finally:
+            close_old_connections()
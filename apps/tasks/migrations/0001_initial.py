@@ -0,0 +1,77 @@
+# Generated by Django 4.1.2 on 2026-10-18 15:51
+
+from django.db import migrations, models
+import django.utils.timezone
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="QueuedTask",
+            fields=[
+                (
+                    "pkid",
+                    models.BigAutoField(
+                        editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now_add=True)),
+                ("name", models.CharField(max_length=200, verbose_name="Task")),
+                ("args", models.JSONField(default=list, verbose_name="Arguments")),
+                (
+                    "kwargs",
+                    models.JSONField(default=dict, verbose_name="Keyword Arguments"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, verbose_name="Attempts"),
+                ),
+                (
+                    "max_attempts",
+                    models.PositiveIntegerField(verbose_name="Max Attempts"),
+                ),
+                (
+                    "run_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="Run At"
+                    ),
+                ),
+                (
+                    "locked_at",
+                    models.DateTimeField(null=True, verbose_name="Locked At"),
+                ),
+                ("last_error", models.TextField(blank=True, verbose_name="Last Error")),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="queuedtask",
+            index=models.Index(
+                fields=["status", "run_at"], name="tasks_status_run_at_idx"
+            ),
+        ),
+    ]
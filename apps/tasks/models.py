@@ -0,0 +1,36 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.common.models import TimeStampedUUIDModel
+
+
+class QueuedTask(TimeStampedUUIDModel):
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        DONE = "done", _("Done")
+        FAILED = "failed", _("Failed")
+
+    name = models.CharField(verbose_name=_("Task"), max_length=200)
+    args = models.JSONField(verbose_name=_("Arguments"), default=list)
+    kwargs = models.JSONField(verbose_name=_("Keyword Arguments"), default=dict)
+    status = models.CharField(
+        verbose_name=_("Status"),
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    attempts = models.PositiveIntegerField(verbose_name=_("Attempts"), default=0)
+    max_attempts = models.PositiveIntegerField(verbose_name=_("Max Attempts"))
+    run_at = models.DateTimeField(verbose_name=_("Run At"), default=timezone.now)
+    locked_at = models.DateTimeField(verbose_name=_("Locked At"), null=True)
+    last_error = models.TextField(verbose_name=_("Last Error"), blank=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.status})"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_at"], name="tasks_status_run_at_idx")
+        ]
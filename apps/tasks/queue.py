@@ -0,0 +1,214 @@
+"""
+A small task queue for side effects, such as sending email, that shouldn't
+hold up a request.
+
+Functions decorated with ``@task`` are queued with ``.enqueue(*args,
+**kwargs)`` and run by the backend named in ``settings.TASKS["BACKEND"]``:
+
+* ``DatabaseBackend``, the default, stores each task as a ``QueuedTask`` row
+  in the caller's transaction, so a task is queued only if the caller
+  commits and survives restarts once it is. ``manage.py run_tasks`` workers
+  run them.
+* ``ThreadPoolBackend`` runs tasks on threads of the web process itself. It
+  needs no worker but loses whatever is queued when the process exits, so
+  it is meant for development.
+* ``ImmediateBackend`` runs tasks in place, which is handy in a shell.
+
+Failed tasks are retried with exponential backoff until they have been
+tried ``MAX_ATTEMPTS`` times. Arguments must be JSON serializable.
+"""
+import functools
+import logging
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import QueuedTask
+
+logger = logging.getLogger(__name__)
+
+registry = {}
+
+
+def retry_delay(attempts):
+    """Seconds to wait before retrying a task that has failed ``attempts`` times."""
+    options = settings.TASKS
+    return min(
+        options["RETRY_BACKOFF"] * 2 ** (attempts - 1), options["RETRY_BACKOFF_MAX"]
+    )
+
+
+class Task:
+    def __init__(self, func, name, max_attempts=None):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.name = name
+        self._max_attempts = max_attempts
+
+    @property
+    def max_attempts(self):
+        return self._max_attempts or settings.TASKS["MAX_ATTEMPTS"]
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def enqueue(self, *args, **kwargs):
+        return get_backend().enqueue(self, args, kwargs)
+
+
+def task(func=None, *, name=None, max_attempts=None):
+    """
+    Register ``func`` as a task under its dotted path, or ``name``.
+    """
+
+    def decorate(func):
+        registered = Task(
+            func, name or f"{func.__module__}.{func.__qualname__}", max_attempts
+        )
+        registry[registered.name] = registered
+        return registered
+
+    if func is None:
+        return decorate
+    return decorate(func)
+
+
+@functools.lru_cache(maxsize=None)
+def get_backend():
+    return import_string(settings.TASKS["BACKEND"])(settings.TASKS)
+
+
+class ImmediateBackend:
+    def __init__(self, options):
+        self.options = options
+
+    def enqueue(self, task, args, kwargs):
+        task(*args, **kwargs)
+
+
+class ThreadPoolBackend:
+    """
+    Runs tasks on a pool of threads in the current process once the
+    enqueuing transaction commits. Retries are scheduled on timers.
+
+    The pool is started on first use, after gunicorn has forked the
+    workers, so each worker gets its own threads.
+    """
+
+    def __init__(self, options):
+        self.workers = options["WORKERS"]
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, task, args, kwargs):
+        transaction.on_commit(lambda: self.submit(task, args, kwargs))
+
+    def submit(self, task, args, kwargs, attempt=1):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="tasks"
+                )
+        return self._executor.submit(self._run, task, args, kwargs, attempt)
+
+    def _run(self, task, args, kwargs, attempt):
+        try:
+            task(*args, **kwargs)
+        except Exception:
+            if attempt >= task.max_attempts:
+                logger.exception(f"task {task.name} failed after {attempt} attempts")
+                return
+            delay = retry_delay(attempt)
+            logger.warning(
+                f"task {task.name} failed, retrying in {delay}s", exc_info=True
+            )
+            timer = threading.Timer(
+                delay, self.submit, (task, args, kwargs, attempt + 1)
+            )
+            timer.daemon = True
+            timer.start()
+        finally:
+            close_old_connections()
+
+
+class DatabaseBackend:
+    def __init__(self, options):
+        self.options = options
+
+    def enqueue(self, task, args, kwargs):
+        return QueuedTask.objects.create(
+            name=task.name,
+            args=list(args),
+            kwargs=kwargs,
+            max_attempts=task.max_attempts,
+        )
+
+
+def claim_tasks(limit):
+    """
+    Lock up to ``limit`` due tasks for this worker and mark them running.
+
+    Rows locked by another worker are skipped rather than waited for, so any
+    number of workers can poll the same table. Tasks left running for longer
+    than ``LOCK_TIMEOUT`` belonged to a worker that died and are claimed
+    again.
+    """
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.TASKS["LOCK_TIMEOUT"])
+    with transaction.atomic():
+        claimed = list(
+            QueuedTask.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=QueuedTask.Status.PENDING, run_at__lte=now)
+                | Q(status=QueuedTask.Status.RUNNING, locked_at__lt=stale)
+            )
+            .order_by("run_at")[:limit]
+        )
+        for queued in claimed:
+            queued.status = QueuedTask.Status.RUNNING
+            queued.locked_at = now
+            queued.attempts += 1
+        QueuedTask.objects.bulk_update(claimed, ["status", "locked_at", "attempts"])
+    return claimed
+
+
+def run_task(queued):
+    """
+    Run a claimed task and record the outcome: done, pending again after a
+    backoff, or failed once it has used up its attempts.
+    """
+    try:
+        task = registry.get(queued.name)
+        if task is None:
+            raise LookupError(f"no task is registered as {queued.name}")
+        task(*queued.args, **queued.kwargs)
+    except Exception:
+        queued.last_error = traceback.format_exc()
+        if queued.attempts >= queued.max_attempts:
+            queued.status = QueuedTask.Status.FAILED
+            logger.error(
+                f"task {queued.name} {queued.id} failed after "
+                f"{queued.attempts} attempts:\n{queued.last_error}"
+            )
+        else:
+            delay = retry_delay(queued.attempts)
+            queued.status = QueuedTask.Status.PENDING
+            queued.run_at = timezone.now() + timedelta(seconds=delay)
+            logger.warning(
+                f"task {queued.name} {queued.id} failed, retrying in {delay}s:\n"
+                f"{queued.last_error}"
+            )
+    else:
+        queued.status = QueuedTask.Status.DONE
+        queued.last_error = ""
+
+    queued.locked_at = None
+    queued.save(update_fields=["status", "run_at", "locked_at", "last_error"])
+    return queued.status
@@ -0,0 +1,105 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+
+class LocalLRUCache:
+    """
+    A small per-process LRU with expiry. Values are stored pickled so every
+    request gets its own copy of the cached objects.
+    """
+
+    def __init__(self, max_size, timeout):
+        self.max_size = max_size
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return pickle.loads(value)
+
+    def set(self, key, value):
+        value = pickle.dumps(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+options = getattr(settings, "JWT_USER_CACHE", {})
+local_cache = LocalLRUCache(
+    max_size=options.get("LOCAL_SIZE", 1024),
+    timeout=options.get("LOCAL_TIMEOUT", 5),
+)
+
+
+def user_cache_key(user_id):
+    return f"users:auth:{user_id}"
+
+
+def invalidate_cached_user(user_id):
+    key = user_cache_key(user_id)
+    local_cache.delete(key)
+    cache.delete(key)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the token's user from a per-process LRU
+    in front of the shared cache before falling back to the database.
+
+    Only the user row is cached. The profile is loaded fresh when a view
+    asks for it, since its review and ranking aggregates are written with
+    ``update()`` and a cached copy saved back would overwrite them.
+
+    Saving a user drops its shared entry. Other processes may keep serving
+    their local copy for up to ``LOCAL_TIMEOUT`` seconds.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        key = user_cache_key(user_id)
+        user = local_cache.get(key)
+        if user is None:
+            user = cache.get(key)
+            if user is None:
+                user = self.get_user_from_db(user_id)
+                cache.set(key, user, options.get("TIMEOUT", 60))
+            local_cache.set(key, user)
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
+
+    def get_user_from_db(self, user_id):
+        try:
+            return self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
@@ -0,0 +1,51 @@
+from django.conf import settings
+from djoser import email
+
+from apps.common.tasks import send_email
+
+
+class QueuedEmailMixin:
+    """
+    Render a djoser email in the request, where the site and user context
+    is at hand, and queue the send instead of talking to SMTP inline.
+    """
+
+    def send(self, to, *args, **kwargs):
+        self.render()
+        html = self.html if self.html != self.body else None
+        send_email.enqueue(
+            self.subject,
+            self.body,
+            kwargs.pop("from_email", settings.DEFAULT_FROM_EMAIL),
+            list(to),
+            reply_to=kwargs.pop("reply_to", None),
+            html=html,
+        )
+
+
+class ActivationEmail(QueuedEmailMixin, email.ActivationEmail):
+    pass
+
+
+class ConfirmationEmail(QueuedEmailMixin, email.ConfirmationEmail):
+    pass
+
+
+class PasswordResetEmail(QueuedEmailMixin, email.PasswordResetEmail):
+    pass
+
+
+class PasswordChangedConfirmationEmail(
+    QueuedEmailMixin, email.PasswordChangedConfirmationEmail
+):
+    pass
+
+
+class UsernameChangedConfirmationEmail(
+    QueuedEmailMixin, email.UsernameChangedConfirmationEmail
+):
+    pass
+
+
+class UsernameResetEmail(QueuedEmailMixin, email.UsernameResetEmail):
+    pass
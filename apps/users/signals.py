@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from pstore.settings.base import AUTH_USER_MODEL
+
+from .authentication import invalidate_cached_user
+
+
+@receiver(post_save, sender=AUTH_USER_MODEL)
+@receiver(post_delete, sender=AUTH_USER_MODEL)
+def invalidate_user(sender, instance, **kwargs):
+    invalidate_cached_user(instance.id)
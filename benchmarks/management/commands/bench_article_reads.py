@@ -0,0 +1,118 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand
+
+
+async def fetch(host, port, path, slow, delay):
+    """
+    Issue one GET over a fresh connection. Slow clients trickle the request
+    in small pieces and read the response in small chunks with a pause
+    between each, the way a client on a poor mobile link would.
+    """
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    request = (
+        f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n"
+    ).encode()
+
+    if slow:
+        for start in range(0, len(request), 16):
+            end = start + 16
+            writer.write(request[start:end])
+            await writer.drain()
+            await asyncio.sleep(delay)
+    else:
+        writer.write(request)
+        await writer.drain()
+
+    status_line = await reader.readline()
+    while await reader.read(1024 if slow else 65536):
+        if slow:
+            await asyncio.sleep(delay)
+
+    writer.close()
+    await writer.wait_closed()
+    return time.perf_counter() - started, int(status_line.split()[1])
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the throughput of the sync and async article read endpoints "
+        "of a running server at high concurrency, with a share of slow "
+        "clients. Each request carries its own query string so the sync "
+        "endpoint's anonymous response cache never answers it"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--concurrency", type=int, default=200)
+        parser.add_argument(
+            "--slow-clients",
+            type=float,
+            default=0.2,
+            help="Fraction of clients that send and read slowly",
+        )
+        parser.add_argument(
+            "--slow-delay",
+            type=float,
+            default=0.05,
+            help="Seconds a slow client pauses between chunks",
+        )
+        parser.add_argument(
+            "--paths",
+            nargs="+",
+            default=["/api/v1/articles/all/", "/api/v1/articles/async/all/"],
+        )
+
+    def handle(self, *args, **options):
+        url = urlsplit(options["base_url"])
+        for path in options["paths"]:
+            elapsed, results = asyncio.run(
+                self.run(url.hostname, url.port or 80, path, options)
+            )
+            self.report(path, elapsed, results)
+
+    async def run(self, host, port, path, options):
+        semaphore = asyncio.Semaphore(options["concurrency"])
+        slow_every = (
+            round(1 / options["slow_clients"]) if options["slow_clients"] else 0
+        )
+
+        separator = "&" if "?" in path else "?"
+
+        async def worker(index):
+            slow = bool(slow_every) and index % slow_every == 0
+            url = f"{path}{separator}request={index}"
+            async with semaphore:
+                try:
+                    return await fetch(host, port, url, slow, options["slow_delay"])
+                except OSError:
+                    return None, None
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(worker(index) for index in range(options["requests"]))
+        )
+        return time.perf_counter() - started, results
+
+    def report(self, path, elapsed, results):
+        latencies = sorted(latency for latency, status in results if status == 200)
+        failures = len(results) - len(latencies)
+        if not latencies:
+            self.stdout.write(self.style.ERROR(f"{path}: all requests failed"))
+            return
+
+        def percentile(rank):
+            return latencies[min(len(latencies) - 1, len(latencies) * rank // 100)]
+
+        self.stdout.write(
+            f"{path}\n"
+            f"  throughput: {len(latencies) / elapsed:.1f} req/s "
+            f"({len(latencies)} ok, {failures} failed in {elapsed:.2f}s)\n"
+            f"  latency p50: {percentile(50) * 1000:.1f} ms, "
+            f"p95: {percentile(95) * 1000:.1f} ms, "
+            f"p99: {percentile(99) * 1000:.1f} ms"
+        )
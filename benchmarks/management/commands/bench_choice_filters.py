@@ -0,0 +1,90 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.articles.models import Article
+from apps.articles.pagination import ArticleKeysetPagination
+from apps.articles.search import compile_search, filter_articles
+from apps.articles.views import ArticleFilter
+from benchmarks.plans import describe_scans, explain_plan, plan_nodes, seed_dataset
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the plans and timings of the old case-insensitive iexact "
+        "filters on advert_type and article_type with the exact matches "
+        "they are compiled to now, on a seeded article table. Needs "
+        "PostgreSQL; the data is rolled back afterwards"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=2000)
+        parser.add_argument("--articles", type=int, default=200000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Query plans can only be compared on PostgreSQL")
+
+        with transaction.atomic():
+            seed_dataset(options["users"], options["articles"])
+            for label, variants in self.cases():
+                self.stdout.write(label)
+                for variant, queryset in variants:
+                    self.report(variant, queryset, options["repeat"])
+            transaction.set_rollback(True)
+
+    def cases(self):
+        params = {"advert_type": "for sale", "article_type": "news article"}
+        iexact = {f"{name}__iexact": value for name, value in params.items()}
+        articles = Article.objects.order_by("-created_at")
+        published = Article.published.all()
+        keyset = ArticleKeysetPagination.ordering
+
+        filtered = ArticleFilter(params, articles).qs
+        searched = filter_articles(published, compile_search(params))
+        return [
+            (
+                "all articles by type, first page",
+                [
+                    ("iexact", articles.filter(**iexact)[:3]),
+                    ("exact", filtered[:3]),
+                ],
+            ),
+            (
+                "all articles by type, every match",
+                [
+                    ("iexact", articles.filter(**iexact).values_list("pkid")),
+                    ("exact", filtered.values_list("pkid")),
+                ],
+            ),
+            (
+                "search by type, first page",
+                [
+                    ("iexact", published.filter(**iexact).order_by(*keyset)[:21]),
+                    ("exact", searched.order_by(*keyset)[:21]),
+                ],
+            ),
+        ]
+
+    def report(self, variant, queryset, repeat):
+        plan = explain_plan(queryset, analyze=True)
+        scans = [
+            node
+            for node in plan_nodes(plan["Plan"])
+            if "Relation Name" in node or "Index Name" in node
+        ]
+
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            list(queryset.all())
+            timings.append(time.perf_counter() - started)
+
+        self.stdout.write(
+            f"  {variant}: {describe_scans(scans)}\n"
+            f"    median {statistics.median(timings) * 1000:.2f} ms over "
+            f"{repeat} runs, {plan['Execution Time']:.2f} ms in the database"
+        )
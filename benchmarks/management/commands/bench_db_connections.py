@@ -0,0 +1,89 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import Client
+from django.test.utils import override_settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure article list latency with a fresh database connection per "
+        "request, with persistent connections and, optionally, through "
+        "pgbouncer"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--path", default="/api/v1/articles/all/")
+        parser.add_argument(
+            "--pgbouncer-host",
+            help="Also measure connecting through pgbouncer at this host",
+        )
+        parser.add_argument("--pgbouncer-port", default="6432")
+
+    def handle(self, *args, **options):
+        modes = [
+            ("fresh connection per request", {"CONN_MAX_AGE": 0}),
+            ("persistent connection", {"CONN_MAX_AGE": None}),
+        ]
+        if options["pgbouncer_host"]:
+            modes.append(
+                (
+                    "pgbouncer, fresh connection per request",
+                    {
+                        "CONN_MAX_AGE": 0,
+                        "HOST": options["pgbouncer_host"],
+                        "PORT": options["pgbouncer_port"],
+                        "DISABLE_SERVER_SIDE_CURSORS": True,
+                    },
+                )
+            )
+
+        for label, overrides in modes:
+            latencies = self.run(options["path"], options["requests"], overrides)
+            self.report(label, latencies)
+
+    def run(self, path, requests, overrides):
+        """
+        Send requests through the full handler, so the request_started and
+        request_finished signals open and close connections the same way
+        they do under a real server. Anonymous responses are not kept in
+        the response cache, so every request reaches the database.
+        """
+        connection = connections[DEFAULT_DB_ALIAS]
+        original = dict(connection.settings_dict)
+        connection.close()
+        connection.settings_dict.update(overrides)
+
+        client = Client()
+        latencies = []
+        try:
+            with override_settings(
+                ALLOWED_HOSTS=["testserver"], ARTICLE_RESPONSE_CACHE_TIMEOUT=0
+            ):
+                client.get(path)
+                for _ in range(requests):
+                    started = time.perf_counter()
+                    response = client.get(path)
+                    latencies.append(time.perf_counter() - started)
+                    if response.status_code != 200:
+                        raise RuntimeError(f"{path} returned {response.status_code}")
+        finally:
+            connection.close()
+            connection.settings_dict.clear()
+            connection.settings_dict.update(original)
+
+        return sorted(latencies)
+
+    def report(self, label, latencies):
+        def percentile(rank):
+            return latencies[min(len(latencies) - 1, len(latencies) * rank // 100)]
+
+        self.stdout.write(
+            f"{label}\n"
+            f"  mean: {sum(latencies) / len(latencies) * 1000:.2f} ms, "
+            f"p50: {percentile(50) * 1000:.2f} ms, "
+            f"p95: {percentile(95) * 1000:.2f} ms, "
+            f"p99: {percentile(99) * 1000:.2f} ms"
+        )
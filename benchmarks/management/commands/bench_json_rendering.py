@@ -0,0 +1,71 @@
+import time
+from itertools import cycle, islice
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from apps.articles.models import Article
+from apps.articles.serializers import ArticleSerializer
+from apps.common.renderers import FastJSONRenderer, orjson
+from apps.profiles.serializers import ProfileSerializer
+from apps.profiles.views import profiles_with_reviews
+
+
+class Command(BaseCommand):
+    help = (
+        "Time rendering serialized Article and Profile payloads with DRF's "
+        "JSONRenderer and with FastJSONRenderer"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write(
+                self.style.WARNING(
+                    "orjson is not installed, FastJSONRenderer uses the "
+                    "standard library encoder"
+                )
+            )
+
+        payloads = {
+            "articles": self.payload(
+                Article.objects.select_related("user"), ArticleSerializer, options
+            ),
+            "profiles": self.payload(
+                profiles_with_reviews(), ProfileSerializer, options
+            ),
+        }
+        for name, data in payloads.items():
+            for renderer in (JSONRenderer(), FastJSONRenderer()):
+                self.report(name, renderer, data, options["repeat"])
+
+    def payload(self, queryset, serializer_class, options):
+        """
+        Serialize ``--size`` rows, repeating the existing ones as needed, so
+        only rendering is timed.
+        """
+        rows = list(queryset[: options["size"]])
+        if not rows:
+            raise CommandError(
+                f"No {queryset.model._meta.verbose_name_plural} to render"
+            )
+        rows = list(islice(cycle(rows), options["size"]))
+        return serializer_class(rows, many=True).data
+
+    def report(self, name, renderer, data, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            content = renderer.render(data)
+            timings.append(time.perf_counter() - started)
+
+        timings.sort()
+        self.stdout.write(
+            f"{name} with {type(renderer).__name__}: "
+            f"best {timings[0] * 1000:.2f} ms, "
+            f"median {timings[len(timings) // 2] * 1000:.2f} ms, "
+            f"{len(content)} bytes"
+        )
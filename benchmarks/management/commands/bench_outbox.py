@@ -0,0 +1,141 @@
+import socketserver
+import threading
+import time
+
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.enquiries.models import Enquiry
+from apps.enquiries.outbox import build_message, deliver_batch, queue_notification
+
+
+class SMTPStandIn(socketserver.StreamRequestHandler):
+    """
+    Just enough of SMTP for Django's backend to deliver mail to, with a
+    fixed delay before each reply to stand in for the round trip to a
+    real mail server.
+    """
+
+    def reply(self, line):
+        time.sleep(self.server.latency)
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.reply("220 localhost ESMTP")
+        while line := self.rfile.readline():
+            command = line[:4].upper()
+            if command in (b"HELO", b"EHLO"):
+                self.reply("250 localhost")
+            elif command == b"DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                with self.server.lock:
+                    self.server.received += 1
+                self.reply("250 OK")
+            elif command == b"QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+class SMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, latency):
+        super().__init__(("127.0.0.1", 0), SMTPStandIn)
+        self.latency = latency
+        self.received = 0
+        self.lock = threading.Lock()
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare sending enquiry notifications over a connection each, the "
+        "way send_mail did, with draining the outbox in batches over one "
+        "connection, against a local SMTP stand-in. The outbox rows are "
+        "rolled back afterwards"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=500)
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.005,
+            help="Seconds the stand-in waits before each reply",
+        )
+
+    def handle(self, *args, **options):
+        server = SMTPServer(options["latency"])
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address
+
+        def connect():
+            return get_connection(
+                "django.core.mail.backends.smtp.EmailBackend",
+                host=host,
+                port=port,
+                username="",
+                password="",
+                use_tls=False,
+                use_ssl=False,
+            )
+
+        try:
+            with transaction.atomic():
+                notifications = self.create_notifications(options["messages"])
+
+                started = time.perf_counter()
+                for notification in notifications:
+                    connection = connect()
+                    connection.send_messages([build_message(notification, connection)])
+                self.report(
+                    "connection per message", len(notifications), started, server
+                )
+
+                server.received = 0
+                started = time.perf_counter()
+                sent = failed = 0
+                while True:
+                    batch_sent, batch_failed = deliver_batch(
+                        options["batch_size"], connection=connect()
+                    )
+                    if not batch_sent and not batch_failed:
+                        break
+                    sent += batch_sent
+                    failed += batch_failed
+                self.report(
+                    f"outbox, batches of {options['batch_size']}", sent, started, server
+                )
+                if failed:
+                    self.stdout.write(self.style.WARNING(f"  {failed} failed"))
+
+                transaction.set_rollback(True)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def create_notifications(self, count):
+        enquiries = Enquiry.objects.bulk_create(
+            Enquiry(
+                name=f"Bench {n}",
+                email=f"bench{n}@example.com",
+                subject=f"Benchmark enquiry {n}",
+                message="Benchmark message",
+            )
+            for n in range(count)
+        )
+        return [queue_notification(enquiry) for enquiry in enquiries]
+
+    def report(self, label, sent, started, server):
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"{label}\n"
+            f"  {sent} sent ({server.received} received) in {elapsed:.2f}s, "
+            f"{sent / elapsed:.1f} messages/s"
+        )
@@ -0,0 +1,96 @@
+"""
+Seeding and EXPLAIN helpers shared by the query plan test and the
+benchmarks. Everything here needs PostgreSQL.
+"""
+import json
+from decimal import Decimal
+from itertools import cycle
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+
+from apps.articles.bulk import bulk_insert_articles
+from apps.articles.models import Article
+from apps.profiles.models import Profile
+
+User = get_user_model()
+
+
+def explain_plan(queryset, analyze=False):
+    """Return the JSON plan PostgreSQL makes for ``queryset``."""
+    sql, params = queryset.query.sql_with_params()
+    options = "ANALYZE, FORMAT JSON" if analyze else "FORMAT JSON"
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN ({options}) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+def plan_nodes(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def describe_scans(nodes):
+    return ", ".join(
+        f"{node['Node Type']} using {node['Index Name']}"
+        if "Index Name" in node
+        else f"{node['Node Type']} on {node['Relation Name']}"
+        for node in nodes
+    )
+
+
+def seed_dataset(user_count, article_count):
+    """
+    Bulk insert users, profiles and articles shaped like production data and
+    refresh the planner statistics. Returns the users.
+
+    About one user in two hundred is an author and one in two thousand a top
+    author, and three in four articles are published. Authors have to be
+    that sparse for an index to beat reading the table: spread one in twenty
+    through the table, there is one on nearly every page.
+    """
+    users = User.objects.bulk_create(
+        User(
+            username=f"plan-check-{n}",
+            email=f"plan-check-{n}@example.com",
+            first_name="Plan",
+            last_name="Check",
+            password="!",
+        )
+        for n in range(user_count)
+    )
+    Profile.objects.bulk_create(
+        Profile(
+            user=user,
+            is_author=n % 200 == 0,
+            top_author=n % 2000 == 0,
+            author_rank=n if n % 2000 == 0 else None,
+        )
+        for n, user in enumerate(users)
+    )
+
+    advert_types = cycle(Article.AdvertType.values)
+    article_types = cycle(Article.ArticleType.values)
+    authors = cycle(users)
+    bulk_insert_articles(
+        [
+            Article(
+                user=next(authors),
+                title=f"Plan check article {n}",
+                advert_type=next(advert_types),
+                article_type=next(article_types),
+                price=Decimal(n % 1000),
+                published_status=n % 4 != 0,
+            )
+            for n in range(article_count)
+        ]
+    )
+
+    with connection.cursor() as cursor:
+        for model in (User, Profile, Article):
+            cursor.execute(f'ANALYZE "{model._meta.db_table}"')
+    return users
@@ -0,0 +1,42 @@
+"""
+Gunicorn settings for the production image, read from the environment.
+
+The app is imported once in the master before the workers fork
+(``preload_app``), so the workers share its memory copy-on-write and a
+broken deploy fails on boot instead of in every worker. Database
+connections are opened lazily per request, so none is shared across the
+fork.
+
+Run the ASGI app instead by setting ``GUNICORN_APP=pstore.asgi:application``
+and ``GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker``. The ASGI app
+turns off persistent database connections (see ``pstore/asgi.py``), so set
+``PGBOUNCER_HOST`` as well when doing so.
+"""
+import multiprocessing
+import os
+
+
+def env_int(name, default):
+    # A key left blank in .env reaches us as "", so treat it as unset
+    return int(os.environ.get(name) or default)
+
+
+wsgi_app = os.environ.get("GUNICORN_APP", "pstore.wsgi:application")
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+workers = env_int("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1)
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+threads = env_int("GUNICORN_THREADS", 4)
+preload_app = True
+
+# Recycle workers now and then so a slow leak can't grow without bound
+max_requests = env_int("GUNICORN_MAX_REQUESTS", 1000)
+max_requests_jitter = env_int("GUNICORN_MAX_REQUESTS_JITTER", 100)
+
+timeout = env_int("GUNICORN_TIMEOUT", 30)
+graceful_timeout = env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+keepalive = env_int("GUNICORN_KEEPALIVE", 5)
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
@@ -3,6 +3,22 @@ ASGI config for pstore project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+The async article endpoints under ``/api/v1/articles/async/`` only pay off
+when served from here. Run one uvicorn worker process per CPU core under
+gunicorn, e.g.::
+
+    gunicorn pstore.asgi:application -k uvicorn.workers.UvicornWorker -w 4
+
+Each worker runs a single event loop: async views wait on the database and on
+slow clients without holding a thread, while the synchronous DRF views are
+run in a thread pool by Django and behave as they do under WSGI.
+
+Persistent database connections are turned off here. Under ASGI each request
+can run on a different thread, and Django 4.1 never closes connections left
+on those threads, so they leak
+(https://code.djangoproject.com/ticket/33497). Put pgbouncer in front of
+PostgreSQL (``PGBOUNCER_HOST``) to keep connection setup cheap.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 """
@@ -11,6 +27,7 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pstore.settings")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pstore.settings.development")
+os.environ["CONN_MAX_AGE"] = "0"
 
 application = get_asgi_application()
@@ -53,6 +53,7 @@ DJANGO_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.sites",
+    "django.contrib.postgres",
 ]
 
 SITE_ID = 1
@@ -72,6 +73,7 @@ LOCAL_APPS = [
     "apps.enquiries",
     "apps.profiles",
     "apps.ratings",
+    "apps.tasks",
     "apps.users",
 ]
 
@@ -160,8 +162,20 @@ AUTH_USER_MODEL = "users.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    )
+        "apps.users.authentication.CachedJWTAuthentication",
+    ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "apps.common.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+}
+
+# Authenticated users are cached for TIMEOUT seconds in the shared cache and
+# for LOCAL_TIMEOUT seconds in a per-process LRU of LOCAL_SIZE entries
+JWT_USER_CACHE = {
+    "TIMEOUT": env.int("JWT_USER_CACHE_TIMEOUT", default=60),
+    "LOCAL_TIMEOUT": env.int("JWT_USER_LOCAL_CACHE_TIMEOUT", default=5),
+    "LOCAL_SIZE": env.int("JWT_USER_LOCAL_CACHE_SIZE", default=1024),
 }
 
 SIMPLE_JWT = {
@@ -194,8 +208,82 @@ DJOSER = {
         "current_user": "apps.users.serializers.UserSerializer",
         "user_delete": "djoser.serializers.UserDeleteSerializer",
     },
+    "EMAIL": {
+        "activation": "apps.users.emails.ActivationEmail",
+        "confirmation": "apps.users.emails.ConfirmationEmail",
+        "password_reset": "apps.users.emails.PasswordResetEmail",
+        "password_changed_confirmation": "apps.users.emails.PasswordChangedConfirmationEmail",
+        "username_changed_confirmation": "apps.users.emails.UsernameChangedConfirmationEmail",
+        "username_reset": "apps.users.emails.UsernameResetEmail",
+    },
 }
 
+# Background tasks such as email. The database backend keeps queued tasks
+# in the database until a `manage.py run_tasks` worker runs them; failures
+# are retried after RETRY_BACKOFF seconds, doubling up to RETRY_BACKOFF_MAX,
+# until a task has been tried MAX_ATTEMPTS times. Tasks left running longer
+# than LOCK_TIMEOUT seconds are taken to belong to a dead worker
+TASKS = {
+    "BACKEND": env("TASKS_BACKEND", default="apps.tasks.queue.DatabaseBackend"),
+    "WORKERS": env.int("TASKS_WORKERS", default=4),
+    "MAX_ATTEMPTS": env.int("TASKS_MAX_ATTEMPTS", default=5),
+    "RETRY_BACKOFF": env.int("TASKS_RETRY_BACKOFF", default=30),
+    "RETRY_BACKOFF_MAX": env.int("TASKS_RETRY_BACKOFF_MAX", default=3600),
+    "LOCK_TIMEOUT": env.int("TASKS_LOCK_TIMEOUT", default=600),
+    "POLL_INTERVAL": env.float("TASKS_POLL_INTERVAL", default=1.0),
+}
+
+# Delivery of enquiry notifications by `manage.py process_outbox`. Failed
+# sends are retried with the TASKS backoff until MAX_ATTEMPTS is reached
+ENQUIRY_OUTBOX = {
+    "BATCH_SIZE": env.int("ENQUIRY_OUTBOX_BATCH_SIZE", default=100),
+    "MAX_ATTEMPTS": env.int("ENQUIRY_OUTBOX_MAX_ATTEMPTS", default=5),
+    "POLL_INTERVAL": env.float("ENQUIRY_OUTBOX_POLL_INTERVAL", default=5.0),
+}
+
+# Shared cache. Keep the local memory default for development and tests; with
+# several server processes use a shared backend such as
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache and
+# CACHE_LOCATION=redis://redis:6379/1 so invalidations reach every process
+CACHES = {
+    "default": {
+        "BACKEND": env(
+            "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": env("CACHE_LOCATION", default="pstore"),
+    }
+}
+
+# Article detail hits are buffered in memory and written behind the request
+ARTICLE_VIEWS_BUFFER = {
+    "ENABLED": env.bool("ARTICLE_VIEWS_BUFFERED", default=True),
+    "FLUSH_INTERVAL": env.int("ARTICLE_VIEWS_FLUSH_INTERVAL", default=30),
+    "MAX_SIZE": env.int("ARTICLE_VIEWS_BUFFER_SIZE", default=1000),
+}
+
+# Resized copies made of every uploaded article image. SIZES are the boxes
+# each variant is fitted into; list endpoints show the thumbnail
+ARTICLE_IMAGE_VARIANTS = {
+    "SIZES": {"thumbnail": (320, 240), "card": (800, 600), "full": (1920, 1920)},
+    "QUALITY": env.int("ARTICLE_IMAGE_QUALITY", default=82),
+}
+
+# Text search configuration used for the article full-text index
+ARTICLE_SEARCH_CONFIG = env("ARTICLE_SEARCH_CONFIG", default="english")
+
+# Seconds a compiled article search keeps its results cached
+ARTICLE_SEARCH_CACHE_TIMEOUT = env.int("ARTICLE_SEARCH_CACHE_TIMEOUT", default=300)
+
+# Most articles accepted by one bulk create, update or delete request
+ARTICLE_BULK_MAX_ITEMS = env.int("ARTICLE_BULK_MAX_ITEMS", default=500)
+
+# Seconds anonymous article list and detail responses stay cached
+ARTICLE_RESPONSE_CACHE_TIMEOUT = env.int("ARTICLE_RESPONSE_CACHE_TIMEOUT", default=300)
+
+# Number of best ranked authors flagged as top authors by rank_authors
+TOP_AUTHORS_COUNT = env.int("TOP_AUTHORS_COUNT", default=20)
+TOP_AUTHORS_CACHE_TIMEOUT = env.int("TOP_AUTHORS_CACHE_TIMEOUT", default=300)
+
 logger = logging.getLogger(__name__)
 
 LOG_LEVEL = "INFO"
@@ -1,6 +1,5 @@
 from .base import *
 
-
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = env("EMAIL_HOST")
 EMAIL_USE_TLS = True
@@ -11,6 +10,12 @@ DEFAULT_FROM_EMAIL = "pstoregr@gmail.com"
 DOMAIN = env("DOMAIN")
 SITE_NAME = "PStore GR"
 
+# Benchmark and query plan commands, kept out of the production settings
+INSTALLED_APPS += ["benchmarks"]
+
+# Run background tasks on threads of the dev server, so no worker is needed
+TASKS["BACKEND"] = env("TASKS_BACKEND", default="apps.tasks.queue.ThreadPoolBackend")
+
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
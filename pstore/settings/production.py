@@ -1 +1,56 @@
 from .base import *
+
+DEBUG = False
+
+EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+EMAIL_HOST = env("EMAIL_HOST")
+EMAIL_USE_TLS = True
+EMAIL_PORT = env("EMAIL_PORT")
+EMAIL_HOST_USER = env("EMAIL_HOST_USER")
+EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD")
+DEFAULT_FROM_EMAIL = "pstoregr@gmail.com"
+DOMAIN = env("DOMAIN")
+SITE_NAME = "PStore GR"
+
+# Database
+# https://docs.djangoproject.com/en/4.1/ref/settings/#databases
+
+DATABASES = {
+    "default": {
+        "ENGINE": env("POSTGRES_ENGINE"),
+        "NAME": env("POSTGRES_DB"),
+        "USER": env("POSTGRES_USER"),
+        "PASSWORD": env("POSTGRES_PASSWORD"),
+        "HOST": env("PG_HOST"),
+        "PORT": env("PG_PORT"),
+        # Keep each worker thread's connection open across requests, and
+        # check it is still usable before reusing it after an error. The ASGI
+        # entry point forces this to 0, see pstore/asgi.py
+        "CONN_MAX_AGE": env.int("CONN_MAX_AGE", default=60),
+        "CONN_HEALTH_CHECKS": True,
+    }
+}
+
+# Route connections through pgbouncer when PGBOUNCER_HOST is set. In
+# transaction pooling mode consecutive transactions may land on different
+# server connections, so named cursors can't outlive a transaction and
+# server-side cursors have to be off.
+# https://docs.djangoproject.com/en/4.1/ref/databases/#transaction-pooling-and-server-side-cursors
+
+PGBOUNCER_HOST = env("PGBOUNCER_HOST", default="")
+if PGBOUNCER_HOST:
+    DATABASES["default"].update(
+        {
+            "HOST": PGBOUNCER_HOST,
+            "PORT": env("PGBOUNCER_PORT", default="6432"),
+            "DISABLE_SERVER_SIDE_CURSORS": True,
+        }
+    )
+
+# The app runs behind a reverse proxy that terminates TLS
+# https://docs.djangoproject.com/en/4.1/ref/settings/#secure-proxy-ssl-header
+
+SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
+CSRF_TRUSTED_ORIGINS = env.list("CSRF_TRUSTED_ORIGINS", default=[])
+SESSION_COOKIE_SECURE = True
+CSRF_COOKIE_SECURE = True
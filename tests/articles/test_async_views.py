@@ -0,0 +1,70 @@
+import pytest
+from django.urls import reverse
+
+pytestmark = pytest.mark.django_db
+
+
+def fetch(client, name, query=""):
+    return client.get(reverse(name) + query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "?page=2",
+        "?ordering=created_at",
+        "?search=GR",
+        "?price__gt=100",
+        "?fields=title,cover_photo",
+    ],
+)
+def test_async_list_matches_sync_list(client, article_factory, query):
+    for price in (50, 150, 250, 350):
+        article_factory(price=price)
+
+    sync_response = fetch(client, "all-articles", query)
+    async_response = fetch(client, "async-all-articles", query)
+
+    assert async_response.status_code == sync_response.status_code == 200
+    sync_data = sync_response.json()
+    for link in ("next", "previous"):
+        if sync_data[link]:
+            sync_data[link] = sync_data[link].replace(
+                reverse("all-articles"), reverse("async-all-articles")
+            )
+    assert async_response.json() == sync_data
+
+
+def test_async_list_builds_absolute_image_urls(client, article_factory):
+    article_factory()
+
+    data = fetch(client, "async-all-articles", "?fields=cover_photo").json()
+
+    assert data["results"][0]["cover_photo"].startswith("http://testserver/")
+
+
+@pytest.mark.parametrize("page", ["9", "0", "last-but-one"])
+def test_async_list_rejects_invalid_pages(client, article_factory, page):
+    article_factory()
+
+    response = fetch(client, "async-all-articles", f"?page={page}")
+
+    assert response.status_code == 404
+    assert response.json() == fetch(client, "all-articles", f"?page={page}").json()
+
+
+def test_async_list_rejects_unknown_choices(client):
+    response = fetch(client, "async-all-articles", "?advert_type=swap")
+
+    assert response.status_code == 400
+    assert "advert_type" in response.json()
+
+
+def test_async_detail_builds_absolute_image_urls(client, article_factory):
+    article = article_factory()
+
+    url = reverse("async-article-details", args=[article.slug])
+    data = client.get(url).json()
+
+    assert data["cover_photo"].startswith("http://testserver/")
@@ -0,0 +1,183 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.articles.exceptions import ArticleNotFound
+from apps.articles.models import Article
+from apps.articles.views import NOT_YOUR_ARTICLE
+from apps.users.authentication import local_cache
+
+pytestmark = pytest.mark.django_db
+
+
+def new_article(title, **fields):
+    return {
+        "title": title,
+        "description": "A description",
+        "price": "10.00",
+        "country": "GR",
+        "advert_type": Article.AdvertType.FOR_SALE,
+        "article_type": Article.ArticleType.NEWS_ARTICLE,
+        **fields,
+    }
+
+
+def count_queries(send, url, data):
+    # Load the user every time rather than from the authentication caches
+    cache.clear()
+    local_cache._entries.clear()
+    with CaptureQueriesContext(connection) as context:
+        response = send(url, data, format="json")
+    assert response.status_code < 300
+    return len(context)
+
+
+def test_bulk_create(auth_client, user):
+    response = auth_client.post(
+        reverse("bulk-create"),
+        [new_article("Same title"), new_article("Same title")],
+        format="json",
+    )
+
+    assert response.status_code == 201
+    articles = Article.objects.order_by("pkid")
+    assert [article.slug for article in articles] == ["same-title", "same-title-2"]
+    assert all(article.user == user and article.ref_code for article in articles)
+
+
+def test_bulk_create_is_all_or_nothing(auth_client):
+    response = auth_client.post(
+        reverse("bulk-create"),
+        [new_article("Valid"), new_article("Invalid", price="not a price")],
+        format="json",
+    )
+
+    assert response.status_code == 400
+    errors = response.json()["errors"]
+    assert errors[0] == {}
+    assert "price" in errors[1]
+    assert not Article.objects.exists()
+
+
+@pytest.mark.parametrize("data", [[], {"title": "Not a list"}])
+def test_bulk_create_requires_a_list(auth_client, data):
+    response = auth_client.post(reverse("bulk-create"), data, format="json")
+
+    assert response.status_code == 400
+
+
+def test_bulk_create_queries_do_not_grow_with_the_batch(auth_client):
+    url = reverse("bulk-create")
+    one = count_queries(auth_client.post, url, [new_article("One")])
+    many = count_queries(
+        auth_client.post, url, [new_article(f"Many {n}") for n in range(10)]
+    )
+
+    assert many == one
+
+
+def test_bulk_update(auth_client, user, article_factory):
+    first, second = article_factory.create_batch(2, user=user)
+    before = first.updated_at
+
+    response = auth_client.patch(
+        reverse("bulk-update"),
+        [
+            {"slug": first.slug, "title": "A New Title"},
+            {"slug": second.slug, "price": "12.50"},
+        ],
+        format="json",
+    )
+
+    assert response.status_code == 200
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert first.title == "A New Title"
+    assert first.slug == "a-new-title"
+    assert first.updated_at > before
+    assert str(second.price) == "12.50"
+    assert [item["slug"] for item in response.json()["results"]] == [
+        "a-new-title",
+        second.slug,
+    ]
+
+
+def test_bulk_update_reports_errors_in_request_order(
+    auth_client, user, article_factory
+):
+    mine = article_factory(user=user)
+    theirs = article_factory()
+
+    response = auth_client.patch(
+        reverse("bulk-update"),
+        [
+            {"slug": "missing", "title": "Missing"},
+            {"slug": mine.slug, "title": "Changed"},
+            {"slug": theirs.slug, "title": "Not mine"},
+            {"slug": mine.slug, "price": "not a price"},
+        ],
+        format="json",
+    )
+
+    assert response.status_code == 400
+    errors = response.json()["errors"]
+    assert errors[0] == {"slug": [ArticleNotFound.default_detail]}
+    assert errors[1] == {}
+    assert errors[2] == {"slug": [NOT_YOUR_ARTICLE]}
+    assert "price" in errors[3]
+    mine.refresh_from_db()
+    assert mine.title != "Changed"
+
+
+def test_bulk_update_queries_do_not_grow_with_the_batch(
+    auth_client, user, article_factory
+):
+    articles = article_factory.create_batch(10, user=user)
+    url = reverse("bulk-update")
+    one = count_queries(
+        auth_client.patch, url, [{"slug": articles[0].slug, "title": "Retitled 0"}]
+    )
+    many = count_queries(
+        auth_client.patch,
+        url,
+        [
+            {"slug": article.slug, "title": f"Retitled {n}"}
+            for n, article in enumerate(articles[1:], 1)
+        ],
+    )
+
+    assert many == one
+
+
+def test_bulk_delete(auth_client, user, article_factory):
+    articles = article_factory.create_batch(2, user=user)
+    kept = article_factory(user=user)
+
+    response = auth_client.post(
+        reverse("bulk-delete"),
+        [article.slug for article in articles],
+        format="json",
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"deleted": 2}
+    assert list(Article.objects.all()) == [kept]
+
+
+def test_bulk_delete_checks_every_owner_first(auth_client, user, article_factory):
+    mine = article_factory(user=user)
+    theirs = article_factory()
+
+    response = auth_client.post(
+        reverse("bulk-delete"), [mine.slug, theirs.slug, "missing"], format="json"
+    )
+
+    assert response.status_code == 400
+    assert response.json()["errors"] == [
+        {},
+        {"slug": [NOT_YOUR_ARTICLE]},
+        {"slug": [ArticleNotFound.default_detail]},
+    ]
+    assert Article.objects.count() == 2
@@ -0,0 +1,72 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image
+
+from apps.articles.images import generate_variants
+from apps.articles.models import Article
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+@pytest.fixture
+def photographed_article(article_factory):
+    buffer = BytesIO()
+    Image.new("RGBA", (2400, 1200), "red").save(buffer, "PNG")
+    article = article_factory()
+    article.cover_photo = default_storage.save(
+        "cover.png", ContentFile(buffer.getvalue())
+    )
+    article.save()
+    return article
+
+
+def generate(article, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        generate_variants(article.pkid, ["cover_photo"])
+    return Article.objects.get(pkid=article.pkid).image_variants["cover_photo"]
+
+
+def test_generate_variants_writes_each_size(
+    settings, photographed_article, django_capture_on_commit_callbacks
+):
+    variants = generate(photographed_article, django_capture_on_commit_callbacks)
+
+    sizes = settings.ARTICLE_IMAGE_VARIANTS["SIZES"]
+    assert variants.keys() == sizes.keys()
+    for variant, (width, height) in sizes.items():
+        with default_storage.open(variants[variant]) as file:
+            image = Image.open(file)
+            assert image.format == "JPEG"
+            assert image.width <= width and image.height <= height
+            assert image.width == 2 * image.height
+
+
+def test_regenerated_variants_replace_the_old_files(
+    photographed_article, django_capture_on_commit_callbacks
+):
+    old = generate(photographed_article, django_capture_on_commit_callbacks)
+    new = generate(photographed_article, django_capture_on_commit_callbacks)
+
+    assert set(old.values()).isdisjoint(new.values())
+    assert not any(default_storage.exists(name) for name in old.values())
+    assert all(default_storage.exists(name) for name in new.values())
+
+
+def test_unreadable_image_is_skipped(
+    photographed_article, django_capture_on_commit_callbacks
+):
+    default_storage.delete(photographed_article.cover_photo.name)
+    default_storage.save(photographed_article.cover_photo.name, ContentFile(b"no"))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        generate_variants(photographed_article.pkid, ["cover_photo"])
+
+    assert Article.objects.get(pkid=photographed_article.pkid).image_variants == {}
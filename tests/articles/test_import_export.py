@@ -0,0 +1,70 @@
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.articles.models import Article
+from apps.articles.serializers import ArticleImportSerializer
+
+pytestmark = pytest.mark.django_db
+
+FIELDS = ArticleImportSerializer.Meta.fields
+
+
+@pytest.mark.parametrize("suffix", ["csv", "ndjson"])
+def test_export_then_import_creates_copies(tmp_path, article_factory, suffix):
+    originals = article_factory.create_batch(3)
+    path = tmp_path / f"articles.{suffix}"
+
+    call_command("export_articles", str(path))
+    call_command("import_articles", str(path))
+
+    articles = Article.objects.order_by("pkid")
+    copies = articles[3:]
+    assert len(copies) == 3
+    assert [
+        Article.objects.filter(pkid=article.pkid).values(*FIELDS).get()
+        for article in copies
+    ] == [
+        Article.objects.filter(pkid=article.pkid).values(*FIELDS).get()
+        for article in originals
+    ]
+    assert len({article.slug for article in articles}) == 6
+    assert len({article.ref_code for article in articles}) == 6
+
+
+def test_export_leaves_out_identity_columns(tmp_path, article_factory):
+    article_factory()
+    path = tmp_path / "articles.csv"
+
+    call_command("export_articles", str(path))
+
+    assert path.read_text().splitlines()[0].split(",") == FIELDS
+
+
+def test_import_rejects_invalid_rows(tmp_path, capsys, user):
+    path = tmp_path / "articles.ndjson"
+    path.write_text(
+        f'{{"user": {user.pkid}, "title": "Valid", "country": "GR"}}\n'
+        "\n"
+        f'{{"user": {user.pkid}, "title": "Invalid", "price": "free"}}\n'
+    )
+
+    call_command("import_articles", str(path))
+
+    output = capsys.readouterr()
+    assert "Imported 1 article(s), 1 rejected" in output.out
+    assert output.err.startswith("line 3: ")
+    assert list(Article.objects.values_list("title", flat=True)) == ["Valid"]
+
+
+@pytest.mark.parametrize("line", ["[1, 2]", '"title"', "null", "{not json"])
+def test_import_stops_at_a_line_that_is_not_an_object(tmp_path, line):
+    path = tmp_path / "articles.ndjson"
+    path.write_text(line + "\n")
+
+    with pytest.raises(CommandError, match="^line 1: "):
+        call_command("import_articles", str(path))
+
+
+def test_import_of_a_missing_file(tmp_path):
+    with pytest.raises(CommandError, match="Can't read"):
+        call_command("import_articles", str(tmp_path / "missing.csv"))
@@ -0,0 +1,59 @@
+import pytest
+from django.urls import reverse
+
+from apps.articles.tracking import view_buffer
+
+pytestmark = pytest.mark.django_db
+
+# A page of articles takes a COUNT and one SELECT with the authors joined in
+LIST_QUERIES = 2
+
+
+@pytest.mark.parametrize("articles", [1, 3])
+def test_article_list_queries(
+    client, django_assert_num_queries, article_factory, articles
+):
+    article_factory.create_batch(articles)
+
+    with django_assert_num_queries(LIST_QUERIES):
+        response = client.get(reverse("all-articles"))
+
+    assert len(response.json()["results"]) == articles
+
+
+@pytest.mark.parametrize("articles", [1, 3])
+def test_author_article_list_queries(
+    auth_client, django_assert_num_queries, user, article_factory, articles
+):
+    article_factory.create_batch(articles, user=user)
+
+    # One more to load the authenticated user
+    with django_assert_num_queries(LIST_QUERIES + 1):
+        response = auth_client.get(reverse("author-articles"))
+
+    assert len(response.json()["results"]) == articles
+
+
+@pytest.mark.parametrize("articles", [1, 20])
+def test_search_queries(client, django_assert_num_queries, article_factory, articles):
+    article_factory.create_batch(articles)
+
+    with django_assert_num_queries(1):
+        response = client.post(reverse("article-search"))
+
+    assert len(response.json()["results"]) == articles
+
+
+def test_article_detail_queries(
+    client, django_assert_num_queries, monkeypatch, article_factory
+):
+    # Leave the view in the buffer, which is not what is being counted
+    monkeypatch.setattr(view_buffer, "enabled", True)
+    monkeypatch.setattr(view_buffer, "flush_interval", 3600)
+    monkeypatch.setattr(view_buffer, "_pending", set())
+    article = article_factory()
+
+    with django_assert_num_queries(1):
+        response = client.get(reverse("article-details", args=[article.slug]))
+
+    assert response.json()["user"] == article.user.username
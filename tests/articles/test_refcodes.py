@@ -0,0 +1,72 @@
+import pytest
+from django.urls import reverse
+
+from apps.articles.models import Article
+from apps.articles.refcodes import (
+    ALPHABET,
+    REF_CODE_LENGTH,
+    allocate_ref_codes,
+    encode_ref_code,
+)
+from tests.utils import requires_postgres
+
+# The random codes articles used to get were this long
+OLD_REF_CODE_LENGTH = 10
+
+
+def test_encode_ref_code_is_one_to_one():
+    codes = [encode_ref_code(value) for value in range(1, 100_001)]
+
+    assert len(set(codes)) == len(codes)
+
+
+@pytest.mark.parametrize("value", [1, 2, 36, 10**6, 2**63 - 1])
+def test_encode_ref_code_shape(value):
+    code = encode_ref_code(value)
+
+    assert len(code) == REF_CODE_LENGTH != OLD_REF_CODE_LENGTH
+    assert set(code) <= set(ALPHABET)
+
+
+def test_consecutive_values_get_unrelated_codes():
+    first, second = encode_ref_code(1), encode_ref_code(2)
+
+    assert first[:-2] != second[:-2]
+
+
+@pytest.mark.django_db
+def test_allocate_no_ref_codes(django_assert_num_queries):
+    with django_assert_num_queries(0):
+        assert allocate_ref_codes(0) == []
+
+
+@requires_postgres
+@pytest.mark.django_db
+def test_allocate_ref_codes_takes_one_query(django_assert_num_queries):
+    with django_assert_num_queries(1):
+        codes = allocate_ref_codes(50)
+
+    assert len(set(codes)) == 50
+
+
+@pytest.mark.django_db
+def test_update_keeps_the_ref_code(auth_client, user, article_factory):
+    article = article_factory(user=user)
+
+    response = auth_client.put(
+        reverse("update-article", args=[article.slug]),
+        {
+            "title": "Retitled",
+            "ref_code": "CHANGED",
+            "description": article.description,
+            "country": "GR",
+            "price": "10.00",
+            "advert_type": article.advert_type,
+            "article_type": article.article_type,
+        },
+        format="json",
+    )
+
+    assert response.status_code == 200
+    assert response.json()["ref_code"] == article.ref_code
+    assert Article.objects.get(pkid=article.pkid).ref_code == article.ref_code
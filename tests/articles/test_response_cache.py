@@ -0,0 +1,100 @@
+import pytest
+from django.urls import reverse
+
+from apps.articles.bulk import bulk_insert_articles, bulk_update_articles
+from apps.articles.models import Article
+
+pytestmark = pytest.mark.django_db
+
+
+def titles(response):
+    return [article["title"] for article in response.json()["results"]]
+
+
+def retitle_quietly(article, title):
+    # A queryset update sends no signal, so cached responses go stale
+    Article.objects.filter(pkid=article.pkid).update(title=title)
+
+
+def test_list_is_served_from_the_cache(client, django_assert_num_queries, article):
+    url = reverse("all-articles")
+    first = client.get(url)
+    retitle_quietly(article, "Stale")
+
+    with django_assert_num_queries(0):
+        second = client.get(url)
+
+    assert second.content == first.content
+    assert second["ETag"] == first["ETag"]
+
+
+def test_matching_etag_gets_a_304(client, article):
+    url = reverse("article-details", args=[article.slug])
+    etag = client.get(url)["ETag"]
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert not response.content
+
+
+def test_stale_etag_gets_the_content(client, article):
+    url = reverse("article-details", args=[article.slug])
+
+    response = client.get(url, HTTP_IF_NONE_MATCH='"stale"')
+
+    assert response.status_code == 200
+    assert response.json()["title"] == article.title
+
+
+def test_equivalent_queries_share_an_entry(client, article):
+    client.get(reverse("all-articles"), {"country": "GR", "ordering": "created_at"})
+    retitle_quietly(article, "Stale")
+
+    response = client.get(
+        reverse("all-articles") + "?ordering=created_at&title=&country=GR"
+    )
+
+    assert titles(response) == [article.title]
+
+
+def test_authenticated_requests_bypass_the_cache(client, auth_client, article):
+    url = reverse("article-details", args=[article.slug])
+    client.get(url)
+    retitle_quietly(article, "Fresh")
+
+    assert auth_client.get(url).json()["title"] == "Fresh"
+    assert client.get(url).json()["title"] == article.title
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pytest.param(lambda article: article.save(), id="save"),
+        pytest.param(lambda article: article.delete(), id="delete"),
+        pytest.param(
+            lambda article: bulk_update_articles([article], ["price"]),
+            id="bulk-update",
+        ),
+        pytest.param(
+            lambda article: bulk_insert_articles([Article(user=article.user)]),
+            id="bulk-insert",
+        ),
+        pytest.param(
+            lambda article: Article.objects.filter(pkid=article.pkid).delete(),
+            id="bulk-delete",
+        ),
+    ],
+)
+def test_changes_invalidate_the_cache(client, article, change):
+    url = reverse("all-articles")
+    client.get(url)
+    retitle_quietly(article, "Fresh")
+    article.refresh_from_db()
+
+    change(article)
+
+    assert titles(client.get(url)) == list(
+        Article.objects.order_by("-created_at").values_list("title", flat=True)
+    )
@@ -0,0 +1,57 @@
+import pytest
+from django.urls import reverse
+
+pytestmark = pytest.mark.django_db
+
+
+def test_cached_search_builds_next_link_per_endpoint(client, article_factory):
+    article_factory.create_batch(3)
+    query = "?page_size=2"
+
+    sync_url = reverse("article-search") + query
+    async_url = reverse("async-article-search") + query
+    sync_next = client.post(sync_url, {}, content_type="application/json").json()
+    async_next = client.post(async_url, {}, content_type="application/json").json()
+
+    assert sync_next["next"].startswith(f"http://testserver{reverse('article-search')}")
+    assert async_next["next"].startswith(
+        f"http://testserver{reverse('async-article-search')}"
+    )
+    assert sync_next["results"] == async_next["results"]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        '{"price": "Infinity"}',
+        '{"price": "NaN"}',
+        '{"price": NaN}',
+        '{"price": "10000"}',
+        '{"price": "1e30"}',
+        '{"total_words": "Infinity"}',
+        '{"total_words": "-Infinity"}',
+        '{"total_words": "1e30"}',
+        '{"keywords": "NaN"}',
+        '{"paragraphs": [1]}',
+        '{"advert_type": "swap"}',
+        '["price", "50"]',
+        '"price"',
+    ],
+)
+@pytest.mark.parametrize("name", ["article-search", "async-article-search"])
+def test_search_rejects_invalid_values(client, name, body):
+    response = client.post(reverse(name), body, content_type="application/json")
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("name", ["article-search", "async-article-search"])
+def test_search_accepts_bucket_labels_and_numbers(client, article_factory, name):
+    article_factory(price=40, total_words=50)
+    article_factory(price=120, total_words=150)
+    body = {"price": "€100,00+", "total_words": 100, "advert_type": "FOR SALE"}
+
+    response = client.post(reverse(name), body, content_type="application/json")
+
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == 1
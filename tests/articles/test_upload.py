@@ -0,0 +1,26 @@
+import pytest
+from django.urls import reverse
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize("data", [{}, {"article_id": ""}])
+def test_upload_requires_article_id(auth_client, data):
+    response = auth_client.post(reverse("article-upload-image"), data)
+
+    assert response.status_code == 400
+    assert "article_id" in response.json()["errors"]
+
+
+def test_upload_rejects_a_json_list(auth_client):
+    response = auth_client.post(reverse("article-upload-image"), [1], format="json")
+
+    assert response.status_code == 400
+
+
+def test_upload_of_unknown_article_is_not_found(auth_client):
+    response = auth_client.post(
+        reverse("article-upload-image"), {"article_id": "not-a-uuid"}
+    )
+
+    assert response.status_code == 404
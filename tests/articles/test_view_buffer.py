@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+
+from apps.articles.models import Article, ArticleViews
+from apps.articles.tracking import ArticleViewBuffer
+
+pytestmark = pytest.mark.django_db
+
+
+def test_flush_writes_the_buffered_views(article_factory):
+    first, second = article_factory.create_batch(2)
+    buffer = ArticleViewBuffer(flush_interval=3600)
+    for article, ip in [(first, "10.0.0.1"), (first, "10.0.0.2"), (second, "10.0.0.1")]:
+        buffer.add(article.pkid, ip)
+    buffer.add(first.pkid, "10.0.0.1")
+
+    assert buffer.flush() == 3
+    assert buffer.flush() == 0
+    assert Article.objects.get(pkid=first.pkid).views == 2
+    assert Article.objects.get(pkid=second.pkid).views == 1
+    assert ArticleViews.objects.count() == 3
+
+
+def test_failed_flush_keeps_the_views(monkeypatch, article_factory):
+    article = article_factory()
+    buffer = ArticleViewBuffer(flush_interval=3600)
+    buffer.add(article.pkid, "10.0.0.1")
+
+    def fail(pending):
+        raise RuntimeError("database is down")
+
+    monkeypatch.setattr(buffer, "_write", fail)
+    assert buffer.flush() == 0
+    monkeypatch.undo()
+
+    assert buffer.flush() == 1
+    assert Article.objects.get(pkid=article.pkid).views == 1
+
+
+def test_idle_buffer_is_flushed_by_the_timer(monkeypatch):
+    written = threading.Event()
+    buffer = ArticleViewBuffer(flush_interval=0.05)
+    monkeypatch.setattr(buffer, "_write", lambda pending: written.set())
+
+    buffer.add(1, "10.0.0.1")
+
+    assert written.wait(timeout=5)
+    assert not buffer._pending
@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+from apps.articles.models import Article, ArticleViews
+from apps.articles.tracking import view_buffer
+from tests.utils import requires_postgres
+
+pytestmark = [pytest.mark.django_db(transaction=True), requires_postgres]
+
+REQUESTS = 20
+
+
+def view_in_parallel(url, ips):
+    def view(ip):
+        try:
+            return Client(REMOTE_ADDR=ip).get(url).status_code
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=len(ips)) as executor:
+        return list(executor.map(view, ips))
+
+
+def test_parallel_views_are_all_counted(article_factory):
+    article = article_factory()
+    ips = [f"10.0.0.{n}" for n in range(REQUESTS)]
+
+    statuses = view_in_parallel(reverse("article-details", args=[article.slug]), ips)
+
+    assert statuses == [200] * REQUESTS
+    assert Article.objects.get(pkid=article.pkid).views == REQUESTS
+    assert ArticleViews.objects.filter(article=article).count() == REQUESTS
+
+
+def test_repeat_views_from_one_ip_are_counted_once(article_factory):
+    article = article_factory()
+    ips = ["10.0.0.1"] * REQUESTS
+
+    view_in_parallel(reverse("article-details", args=[article.slug]), ips)
+
+    assert Article.objects.get(pkid=article.pkid).views == 1
+
+
+def test_buffered_views_are_all_counted_on_flush(monkeypatch, article_factory):
+    monkeypatch.setattr(view_buffer, "enabled", True)
+    monkeypatch.setattr(view_buffer, "flush_interval", 3600)
+    article = article_factory()
+    ips = [f"10.0.0.{n}" for n in range(REQUESTS)] * 2
+
+    view_in_parallel(reverse("article-details", args=[article.slug]), ips)
+
+    assert view_buffer.flush() == REQUESTS
+    assert Article.objects.get(pkid=article.pkid).views == REQUESTS
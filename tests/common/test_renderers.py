@@ -0,0 +1,73 @@
+import math
+import uuid
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy as _
+from rest_framework.renderers import JSONRenderer
+
+from apps.common.renderers import FastJSONRenderer, dumps
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"title": "Flat", "price": Decimal("120.50"), "views": 3},
+        [
+            1e16,
+            1.5e17,
+            1.5e-5,
+            1e-6,
+            1e-7,
+            1e-12,
+            1e-4,
+            0.1,
+            1 / 3,
+            -0.0,
+            123456789.125,
+        ],
+        {"huge": 2**64, "negative": -(2**70), "small": 2**63 - 1},
+        {"id": uuid.UUID(int=1), "label": _("Male")},
+        {
+            "at": datetime(2026, 10, 18, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            "naive": datetime(2026, 10, 18, 12, 30, 15, 120000),
+            "day": date(2026, 10, 18),
+            "time": time(12, 30, 15, 999999),
+        },
+        {"text": "1e16 and 0.00001", "separators": "  ", "ελληνικά": "ναι"},
+        {1: "one", "nested": {"list": [None, True, False]}},
+    ],
+)
+def test_dumps_matches_json_renderer(data):
+    assert dumps(data) == JSONRenderer().render(data)
+
+
+def test_dumps_encodes_uuid_payloads_once(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("fell back to JSONRenderer")
+
+    monkeypatch.setattr(JSONRenderer, "render", fail)
+    rows = [
+        {"id": uuid.UUID("10000000-1e16-4e12-8e99-0000000e1000"), "tags": ["0.00001"]}
+    ]
+    rows += [
+        {"id": uuid.uuid4(), "slug": f"{uuid.uuid4()}", "price": "9.99", "rating": 4.5}
+        for _ in range(100)
+    ]
+
+    assert dumps({"count": len(rows), "results": rows})
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_dumps_writes_non_finite_floats_as_null(value):
+    assert dumps({"rating": value}) == b'{"rating":null}'
+
+
+def test_fast_renderer_indents_like_json_renderer():
+    data = {"results": [{"title": "Flat"}]}
+    context = {"indent": 4}
+
+    assert FastJSONRenderer().render(data, renderer_context=context) == (
+        JSONRenderer().render(data, renderer_context=context)
+    )
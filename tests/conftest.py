@@ -0,0 +1,40 @@
+import pytest
+from django.core.cache import cache
+from pytest_factoryboy import register
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.articles.tracking import view_buffer
+from apps.users.authentication import local_cache
+
+from .factories import ArticleFactory, UserFactory
+
+register(UserFactory)
+register(ArticleFactory)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    cache.clear()
+    local_cache._entries.clear()
+    yield
+    cache.clear()
+    local_cache._entries.clear()
+
+
+@pytest.fixture(autouse=True)
+def unbuffered_views(monkeypatch):
+    """Record article views during the request instead of behind it."""
+    monkeypatch.setattr(view_buffer, "enabled", False)
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def auth_client(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    return client
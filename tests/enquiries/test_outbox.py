@@ -0,0 +1,133 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import connection
+from django.utils import timezone
+
+from apps.enquiries.models import Enquiry, EnquiryNotification
+from apps.enquiries.outbox import deliver_batch, queue_notification
+from tests.utils import requires_postgres
+
+Status = EnquiryNotification.Status
+
+
+class RefusingBackend(EmailBackend):
+    """Refuses messages whose subject is in ``refused``."""
+
+    def __init__(self, refused=(), **kwargs):
+        super().__init__(**kwargs)
+        self.refused = set(refused)
+
+    def send_messages(self, messages):
+        for message in messages:
+            if message.subject in self.refused:
+                raise ConnectionError(f"refused {message.subject}")
+        return super().send_messages(messages)
+
+
+class OverlappingBackend(EmailBackend):
+    """Sends only once every worker has claimed its batch."""
+
+    def __init__(self, barrier, **kwargs):
+        super().__init__(**kwargs)
+        self.barrier = barrier
+
+    def open(self):
+        self.barrier.wait()
+        return super().open()
+
+
+def queue(count):
+    return [
+        queue_notification(
+            Enquiry.objects.create(
+                name=f"Enquirer {n}",
+                email=f"enquirer{n}@example.com",
+                subject=f"Enquiry {n}",
+                message="Is this still available?",
+            )
+        )
+        for n in range(count)
+    ]
+
+
+def make_due(notifications):
+    EnquiryNotification.objects.filter(
+        pkid__in=[notification.pkid for notification in notifications]
+    ).update(next_attempt_at=timezone.now())
+
+
+@pytest.mark.django_db
+def test_deliver_batch_marks_sent():
+    notifications = queue(3)
+
+    assert deliver_batch(connection=RefusingBackend()) == (3, 0)
+
+    assert len(mail.outbox) == 3
+    for notification in EnquiryNotification.objects.filter(
+        pkid__in=[n.pkid for n in notifications]
+    ):
+        assert notification.status == Status.SENT
+        assert notification.attempts == 1
+        assert notification.sent_at is not None
+        assert notification.last_error == ""
+
+
+@pytest.mark.django_db
+def test_deliver_batch_retries_failures_then_gives_up(settings):
+    settings.ENQUIRY_OUTBOX = {**settings.ENQUIRY_OUTBOX, "MAX_ATTEMPTS": 2}
+    refused, delivered = queue(2)
+    backend = RefusingBackend(refused=[refused.subject])
+
+    assert deliver_batch(connection=backend) == (1, 1)
+
+    refused.refresh_from_db()
+    assert refused.status == Status.PENDING
+    assert refused.attempts == 1
+    assert refused.next_attempt_at > timezone.now()
+    assert "refused" in refused.last_error
+    # Not due yet, so nothing is sent
+    assert deliver_batch(connection=backend) == (0, 0)
+
+    make_due([refused])
+    assert deliver_batch(connection=backend) == (0, 1)
+
+    refused.refresh_from_db()
+    assert refused.status == Status.FAILED
+    assert refused.attempts == 2
+    assert [message.subject for message in mail.outbox] == [delivered.subject]
+
+
+@pytest.mark.django_db
+def test_deliver_batch_sends_each_notification_once():
+    notifications = queue(3)
+
+    assert deliver_batch(connection=RefusingBackend()) == (3, 0)
+    make_due(notifications)
+    assert deliver_batch(connection=RefusingBackend()) == (0, 0)
+
+    assert len(mail.outbox) == 3
+
+
+@requires_postgres
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_workers_send_each_notification_once():
+    queue(10)
+    barrier = threading.Barrier(2, timeout=10)
+
+    def work(batch_size):
+        backend = OverlappingBackend(barrier)
+        try:
+            return deliver_batch(batch_size, connection=backend)
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(work, [6, 6]))
+
+    assert sorted(results) == [(4, 0), (6, 0)]
+    subjects = [message.subject for message in mail.outbox]
+    assert len(subjects) == len(set(subjects)) == 10
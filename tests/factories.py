@@ -0,0 +1,32 @@
+import factory
+from django.contrib.auth import get_user_model
+
+from apps.articles.models import Article
+
+User = get_user_model()
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    """Users get their profile from the ``create_user_profile`` signal."""
+
+    username = factory.Sequence(lambda n: f"user{n}")
+    first_name = factory.Faker("first_name")
+    last_name = factory.Faker("last_name")
+    email = factory.LazyAttribute(lambda user: f"{user.username}@example.com")
+    password = "!"
+
+    class Meta:
+        model = User
+
+
+class ArticleFactory(factory.django.DjangoModelFactory):
+    user = factory.SubFactory(UserFactory)
+    title = factory.Sequence(lambda n: f"Article {n}")
+    description = factory.Faker("sentence")
+    price = factory.Faker("pydecimal", left_digits=4, right_digits=2, positive=True)
+    advert_type = Article.AdvertType.FOR_SALE
+    article_type = Article.ArticleType.NEWS_ARTICLE
+    published_status = True
+
+    class Meta:
+        model = Article
@@ -0,0 +1,45 @@
+import pytest
+from django.urls import reverse
+
+from apps.profiles.models import Profile
+from apps.ratings.models import Rating
+
+pytestmark = pytest.mark.django_db
+
+# The authenticated user, the profiles with their users joined, and their
+# reviews with the raters joined
+AUTHOR_LIST_QUERIES = 3
+
+
+def add_reviews(author, raters):
+    Rating.objects.bulk_create(
+        Rating(rater=rater, author=author.profile, rating=4, comment="Good")
+        for rater in raters
+    )
+
+
+@pytest.mark.parametrize("authors,reviews", [(1, 0), (1, 1), (3, 4)])
+def test_author_list_queries(
+    auth_client, django_assert_num_queries, user_factory, authors, reviews
+):
+    raters = user_factory.create_batch(reviews)
+    for author in user_factory.create_batch(authors):
+        Profile.objects.filter(user=author).update(is_author=True)
+        add_reviews(author, raters)
+
+    with django_assert_num_queries(AUTHOR_LIST_QUERIES):
+        response = auth_client.get(reverse("all-authors"))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("reviews", [0, 1, 4])
+def test_own_profile_queries(
+    auth_client, django_assert_num_queries, user, user_factory, reviews
+):
+    add_reviews(user, user_factory.create_batch(reviews))
+
+    with django_assert_num_queries(AUTHOR_LIST_QUERIES):
+        response = auth_client.get(reverse("get_profile"))
+
+    assert response.status_code == 200
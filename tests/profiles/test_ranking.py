@@ -0,0 +1,51 @@
+import pytest
+from django.core.management import call_command
+
+from apps.profiles.models import Profile
+from apps.profiles.ranking import rank_authors
+from tests.utils import requires_postgres
+
+pytestmark = [requires_postgres, pytest.mark.django_db]
+
+
+def author(user_factory, rating, num_reviews, **fields):
+    profile = user_factory().profile
+    Profile.objects.filter(pkid=profile.pkid).update(
+        is_author=True, rating=rating, num_reviews=num_reviews, **fields
+    )
+    return profile
+
+
+def test_rank_authors(settings, user_factory, article_factory):
+    settings.TOP_AUTHORS_COUNT = 2
+    good = author(user_factory, 4.5, 10)
+    viewed = author(user_factory, 4.5, 10)
+    article_factory(user=viewed.user, views=1000)
+    poor = author(user_factory, 1, 2)
+    former = user_factory().profile
+    Profile.objects.filter(pkid=former.pkid).update(
+        author_rank=1, rank_score=10, top_author=True
+    )
+
+    assert rank_authors() == 3
+
+    ranking = list(
+        Profile.objects.filter(author_rank__isnull=False)
+        .order_by("author_rank")
+        .values_list("pkid", "top_author")
+    )
+    assert ranking == [(viewed.pkid, True), (good.pkid, True), (poor.pkid, False)]
+    former.refresh_from_db()
+    assert (former.author_rank, former.rank_score, former.top_author) == (
+        None,
+        None,
+        False,
+    )
+
+
+def test_rank_authors_command(user_factory, capsys):
+    author(user_factory, 3, 1)
+
+    call_command("rank_authors")
+
+    assert "Ranked 1 author(s)" in capsys.readouterr().out
@@ -0,0 +1,28 @@
+import pytest
+from django.urls import reverse
+
+from apps.profiles.models import Profile
+
+pytestmark = pytest.mark.django_db
+
+
+def test_update_profile_keeps_review_aggregates(auth_client, user):
+    # Authenticate once so the user is cached before the review lands
+    assert auth_client.get(reverse("get_profile")).status_code == 200
+
+    Profile.objects.add_review(user.profile.pkid, 4)
+    url = reverse("update_profile", args=[user.username])
+    response = auth_client.patch(url, {"city": "Patras"})
+
+    assert response.status_code == 200
+    profile = Profile.objects.get(pkid=user.profile.pkid)
+    assert profile.city == "Patras"
+    assert profile.num_reviews == 1
+    assert profile.rating == 4
+
+
+def test_update_profile_rejects_invalid_data(auth_client, user):
+    url = reverse("update_profile", args=[user.username])
+    response = auth_client.patch(url, {"gender": "Unknown"})
+
+    assert response.status_code == 400
@@ -0,0 +1,102 @@
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.profiles.models import Profile, average_rating
+from apps.ratings.models import Rating
+from tests.utils import requires_postgres
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def author(user_factory):
+    profile = user_factory().profile
+    profile.is_author = True
+    profile.save()
+    return profile
+
+
+def review(rater, author, rating):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(rater)}")
+    return client.post(
+        reverse("create-rating", args=[author.id]),
+        {"rating": rating, "comment": "Reviewed"},
+        format="json",
+    )
+
+
+@pytest.mark.parametrize(
+    "total, count, rating",
+    [
+        (4, 1, "4.00"),
+        (33, 8, "4.13"),
+        (201, 200, "1.01"),
+        (10, 3, "3.33"),
+        (0, 0, None),
+    ],
+)
+def test_average_rating_rounds_half_up(total, count, rating):
+    assert average_rating(total, count) == (rating and Decimal(rating))
+
+
+# 33 over 8 reviews, 4.125 on average
+RATINGS = [5, 5, 5, 5, 4, 4, 4, 1]
+
+
+def test_review_updates_the_author_aggregates(user_factory, author):
+    for rating in RATINGS:
+        assert review(user_factory(), author, rating).status_code == 200
+
+    author.refresh_from_db()
+    assert author.num_reviews == 8
+    assert author.rating_total == 33
+
+
+def test_review_of_yourself_is_refused(author):
+    response = review(author.user, author, 5)
+
+    assert response.status_code == 403
+    author.refresh_from_db()
+    assert author.num_reviews == 0
+
+
+def test_recompute_ratings_repairs_drift(user_factory, author):
+    for rating in RATINGS:
+        review(user_factory(), author, rating)
+    Profile.objects.filter(pkid=author.pkid).update(num_reviews=7, rating=4)
+    other = user_factory().profile
+    Profile.objects.filter(pkid=other.pkid).update(
+        num_reviews=3, rating_total=12, rating=4
+    )
+
+    call_command("recompute_ratings")
+
+    author.refresh_from_db()
+    other.refresh_from_db()
+    assert (author.num_reviews, author.rating_total, author.rating) == (
+        8,
+        33,
+        Decimal("4.13"),
+    )
+    assert (other.num_reviews, other.rating_total, other.rating) == (0, 0, None)
+
+
+# SQLite has no numeric type to divide in, so only PostgreSQL rounds the
+# average in add_review() the way average_rating() does
+@requires_postgres
+def test_review_and_recompute_ratings_round_alike(user_factory, author, capsys):
+    for rating in RATINGS:
+        review(user_factory(), author, rating)
+    assert Rating.objects.count() == 8
+    author.refresh_from_db()
+    assert author.rating == Decimal("4.13")
+
+    call_command("recompute_ratings")
+
+    assert "Repaired 0 profile(s)" in capsys.readouterr().out
@@ -0,0 +1,176 @@
+import threading
+from datetime import timedelta
+
+import pytest
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.tasks.models import QueuedTask
+from apps.tasks.queue import ThreadPoolBackend, claim_tasks, retry_delay, run_task, task
+from tests.utils import requires_postgres
+
+calls = []
+
+
+@task(name="tests.record")
+def record(value):
+    calls.append(value)
+
+
+@task(name="tests.fail")
+def fail():
+    raise RuntimeError("failed")
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+
+
+def queue(name="tests.record", args=(1,), **fields):
+    return QueuedTask.objects.create(
+        name=name, args=list(args), max_attempts=3, **fields
+    )
+
+
+@pytest.mark.parametrize("attempts, delay", [(1, 30), (2, 60), (3, 120), (10, 3600)])
+def test_retry_delay_doubles_up_to_the_maximum(attempts, delay):
+    assert retry_delay(attempts) == delay
+
+
+@pytest.mark.django_db
+def test_claim_tasks_takes_due_tasks_in_order():
+    now = timezone.now()
+    later = queue(run_at=now - timedelta(minutes=1))
+    first = queue(run_at=now - timedelta(minutes=2))
+    queue(run_at=now + timedelta(minutes=1))
+    queue(status=QueuedTask.Status.DONE, run_at=now - timedelta(minutes=3))
+
+    claimed = claim_tasks(10)
+
+    assert [queued.pkid for queued in claimed] == [first.pkid, later.pkid]
+    for queued in QueuedTask.objects.filter(pkid__in=[first.pkid, later.pkid]):
+        assert queued.status == QueuedTask.Status.RUNNING
+        assert queued.attempts == 1
+        assert queued.locked_at is not None
+    assert claim_tasks(10) == []
+
+
+@pytest.mark.django_db
+def test_claim_tasks_reclaims_stale_running_tasks(settings):
+    now = timezone.now()
+    lock_timeout = timedelta(seconds=settings.TASKS["LOCK_TIMEOUT"])
+    stale = queue(
+        status=QueuedTask.Status.RUNNING,
+        attempts=1,
+        locked_at=now - lock_timeout - timedelta(seconds=1),
+    )
+    queue(status=QueuedTask.Status.RUNNING, attempts=1, locked_at=now)
+
+    claimed = claim_tasks(10)
+
+    assert [queued.pkid for queued in claimed] == [stale.pkid]
+    assert claimed[0].attempts == 2
+
+
+@pytest.mark.django_db
+def test_run_task_records_success():
+    queue(args=["done"])
+    (queued,) = claim_tasks(1)
+
+    assert run_task(queued) == QueuedTask.Status.DONE
+    assert calls == ["done"]
+    queued.refresh_from_db()
+    assert queued.locked_at is None
+
+
+@pytest.mark.django_db
+def test_failed_task_is_retried_after_a_backoff():
+    queue(name="tests.fail", args=())
+    (queued,) = claim_tasks(1)
+    before = timezone.now()
+
+    assert run_task(queued) == QueuedTask.Status.PENDING
+
+    queued.refresh_from_db()
+    assert queued.run_at >= before + timedelta(seconds=retry_delay(1))
+    assert "RuntimeError: failed" in queued.last_error
+    assert claim_tasks(1) == []
+
+
+@pytest.mark.django_db
+def test_task_fails_after_max_attempts():
+    queued = queue(name="tests.fail", args=(), attempts=2)
+    (queued,) = claim_tasks(1)
+
+    assert run_task(queued) == QueuedTask.Status.FAILED
+    queued.refresh_from_db()
+    assert queued.attempts == queued.max_attempts == 3
+    assert queued.status == QueuedTask.Status.FAILED
+
+
+@pytest.mark.django_db
+def test_unknown_task_is_an_error():
+    queue(name="tests.unknown")
+    (queued,) = claim_tasks(1)
+
+    assert run_task(queued) == QueuedTask.Status.PENDING
+    assert "no task is registered as tests.unknown" in queued.last_error
+
+
+@requires_postgres
+@pytest.mark.django_db(transaction=True)
+def test_claim_tasks_skips_rows_locked_by_another_worker():
+    locked, free = queue(), queue()
+    held, release = threading.Event(), threading.Event()
+
+    def hold_lock():
+        try:
+            with transaction.atomic():
+                QueuedTask.objects.select_for_update().get(pkid=locked.pkid)
+                held.set()
+                release.wait(timeout=10)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=hold_lock)
+    thread.start()
+    try:
+        assert held.wait(timeout=10)
+        claimed = claim_tasks(10)
+    finally:
+        release.set()
+        thread.join()
+
+    assert [queued.pkid for queued in claimed] == [free.pkid]
+
+
+@pytest.mark.django_db
+def test_thread_pool_backend_runs_tasks_after_commit(
+    monkeypatch, settings, django_capture_on_commit_callbacks
+):
+    backend = ThreadPoolBackend(settings.TASKS)
+    submitted = []
+    monkeypatch.setattr(
+        backend, "submit", lambda *args: submitted.append(args), raising=True
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        backend.enqueue(record, (1,), {})
+        assert submitted == []
+
+    assert submitted == [(record, (1,), {})]
+
+
+@pytest.mark.django_db
+def test_thread_pool_backend_drops_tasks_of_a_rolled_back_transaction(
+    settings, django_capture_on_commit_callbacks
+):
+    backend = ThreadPoolBackend(settings.TASKS)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        with pytest.raises(RuntimeError), transaction.atomic():
+            backend.enqueue(record, (1,), {})
+            raise RuntimeError
+
+    assert callbacks == []
@@ -0,0 +1,73 @@
+import pytest
+from django.db import transaction
+
+from apps.articles.models import Article
+from apps.articles.pagination import ArticleKeysetPagination
+from apps.articles.search import compile_search, filter_articles
+from apps.articles.views import ArticleFilter, ListAllArticlesAPIView
+from apps.profiles.models import Profile
+from apps.profiles.views import AuthorListAPIView, TopAuthorsListAPIView
+from benchmarks.plans import describe_scans, explain_plan, plan_nodes, seed_dataset
+from tests.utils import requires_postgres
+
+pytestmark = [requires_postgres, pytest.mark.django_db]
+
+# Big enough that reading a whole table costs more than an index lookup
+USERS = 20000
+ARTICLES = 50000
+
+BY_TYPE = {
+    "advert_type": Article.AdvertType.FOR_SALE,
+    "article_type": Article.ArticleType.NEWS_ARTICLE,
+}
+BY_PRICE = {"price__gt": 990}
+
+
+@pytest.fixture(scope="module")
+def authors(django_db_setup, django_db_blocker):
+    """Seed once for the module and roll the data back at the end."""
+    with django_db_blocker.unblock():
+        with transaction.atomic():
+            yield seed_dataset(USERS, ARTICLES)
+            transaction.set_rollback(True)
+
+
+def all_articles():
+    return ListAllArticlesAPIView.queryset.all()
+
+
+def published_in_keyset_order(search=()):
+    queryset = filter_articles(Article.published.all(), search)
+    return queryset.order_by(*ArticleKeysetPagination.ordering)
+
+
+CASES = {
+    "all articles": lambda author: all_articles()[:3],
+    "all articles by type": lambda author: ArticleFilter(BY_TYPE, all_articles()).qs[
+        :3
+    ],
+    "all articles by price": lambda author: ArticleFilter(BY_PRICE, all_articles()).qs[
+        :3
+    ],
+    "author's articles": lambda author: all_articles().filter(user=author)[:3],
+    "search": lambda author: published_in_keyset_order()[:21],
+    "search by type": lambda author: published_in_keyset_order(compile_search(BY_TYPE))[
+        :21
+    ],
+    "authors": lambda author: AuthorListAPIView.queryset.all(),
+    "top authors": lambda author: TopAuthorsListAPIView.queryset.all()[:10],
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_list_queries_use_indexes(authors, case):
+    plan = explain_plan(CASES[case](authors[0]))
+
+    tables = {Article._meta.db_table, Profile._meta.db_table}
+    scans = [
+        node
+        for node in plan_nodes(plan["Plan"])
+        if node.get("Relation Name") in tables or "Index Name" in node
+    ]
+    sequential = [node for node in scans if node["Node Type"] == "Seq Scan"]
+    assert not sequential, describe_scans(scans)
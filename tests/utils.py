@@ -0,0 +1,9 @@
+import pytest
+from django.db import connection
+
+# For tests that need PostgreSQL itself: its planner, numeric arithmetic, or
+# row locking under concurrent writers, which SQLite serializes with table
+# locks instead
+requires_postgres = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="needs PostgreSQL"
+)